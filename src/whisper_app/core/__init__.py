@@ -10,11 +10,45 @@ Contiene los componentes fundamentales para la funcionalidad principal:
 - Gestionar configuración
 """
 
-from whisper_app.core.config_manager import ConfigManager
-from whisper_app.core.transcriber import Transcriber
-from whisper_app.core.recorder import AudioRecorder
-from whisper_app.core.file_manager import FileManager
-from whisper_app.core.realtime_transcriber import RealtimeTranscriber
-from whisper_app.core.exceptions import (
-    WhisperAppError, ConfigError, FFMpegError, ModelLoadError, TranscriptionError, RecordingError, FileProcessingError
-)
\ No newline at end of file
+import importlib
+
+# Los submódulos se cargan al acceder al primer símbolo que exportan
+# (PEP 562): importar un submódulo (p.ej. core.exceptions desde utils) no
+# arrastra al resto del paquete ni a dependencias como sounddevice.
+_LAZY_EXPORTS = {
+    'config_manager': ('ConfigManager',),
+    'transcriber': ('Transcriber',),
+    'recorder': ('AudioRecorder',),
+    'file_manager': ('FileManager',),
+    'realtime_transcriber': ('RealtimeTranscriber',),
+    'transcription_cache': ('TranscriptionCache',),
+    'exceptions': (
+        'WhisperAppError',
+        'ConfigError',
+        'FFMpegError',
+        'ModelLoadError',
+        'TranscriptionError',
+        'RecordingError',
+        'FileProcessingError',
+    ),
+}
+
+_LAZY_NAMES = {
+    name: module for module, names in _LAZY_EXPORTS.items() for name in names
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
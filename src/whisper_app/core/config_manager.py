@@ -41,6 +41,7 @@ class ConfigManager:
         os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
         
         # Cargar configuración existente o crear una nueva
+        self.default_config = self._get_default_config()
         self.config = self.load_config()
         
         logger.debug(f"Configuración inicializada desde {self.config_file}")
@@ -144,7 +145,9 @@ class ConfigManager:
             "ui_language": "auto",
             "advanced_mode": False,
             "use_model_cache": True,
-            "model_cache_dir": MODELS_DIR
+            "prefetch_model": True,  # Cargar el último modelo usado al iniciar
+            "model_cache_dir": MODELS_DIR,
+            "cache_max_mb": 500  # Tamaño máximo de la caché de transcripciones
         }
     
     def get(self, key: str, default: Any = None) -> Any:
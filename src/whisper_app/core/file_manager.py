@@ -8,12 +8,14 @@ import os
 import shutil
 import tempfile
 import logging
+import threading
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from whisper_app.utils import ffmpeg_utils, audio_utils, text_utils
-from whisper_app.models import TranscriptionResult
+from whisper_app.models import TranscriptionModel
 from whisper_app.core.config_manager import ConfigManager
 from whisper_app.core.exceptions import (
     FileProcessingError, FFMpegError, ConfigError, WhisperAppError
@@ -21,6 +23,32 @@ from whisper_app.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac', '.wma')
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi', '.mkv', '.webm', '.wmv')
+
+@lru_cache(maxsize=8)
+def _build_file_filter(extensions):
+    """
+    Construye el filtro de QFileDialog para una tupla de extensiones
+
+    Se memoiza por tupla de extensiones: si la lista soportada cambia,
+    la clave cambia y el filtro se recalcula.
+
+    Args:
+        extensions (tuple): Extensiones soportadas (con punto)
+
+    Returns:
+        str: Filtro para QFileDialog
+    """
+    audio_exts = [ext[1:] for ext in extensions if ext in AUDIO_EXTENSIONS]
+    video_exts = [ext[1:] for ext in extensions if ext in VIDEO_EXTENSIONS]
+
+    audio_filter = f"Archivos de audio ({' '.join(['*.' + ext for ext in audio_exts])})"
+    video_filter = f"Archivos de video ({' '.join(['*.' + ext for ext in video_exts])})"
+    all_filter = f"Todos los archivos soportados ({' '.join(['*.' + ext[1:] for ext in extensions])})"
+
+    return f"{all_filter};;{audio_filter};;{video_filter};;Todos los archivos (*.*)"
+
 class FileManager:
     """Gestiona los archivos de audio/video y transcripciones"""
     
@@ -33,6 +61,7 @@ class FileManager:
         """
         self.config = config_manager
         self.temp_files = []  # Registrar archivos temporales
+        self._write_lock = threading.Lock()  # Serializa escrituras desde hilos de exportación
         
         # Formatos de archivo soportados
         self.supported_extensions = [
@@ -74,17 +103,7 @@ class FileManager:
         Returns:
             str: Filtro para QFileDialog
         """
-        audio_exts = [ext[1:] for ext in self.supported_extensions 
-                      if ext in ['.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac', '.wma']]
-        
-        video_exts = [ext[1:] for ext in self.supported_extensions 
-                      if ext in ['.mp4', '.mov', '.avi', '.mkv', '.webm', '.wmv']]
-        
-        audio_filter = f"Archivos de audio ({' '.join(['*.' + ext for ext in audio_exts])})"
-        video_filter = f"Archivos de video ({' '.join(['*.' + ext for ext in video_exts])})"
-        all_filter = f"Todos los archivos soportados ({' '.join(['*.' + ext[1:] for ext in self.supported_extensions])})"
-        
-        return f"{all_filter};;{audio_filter};;{video_filter};;Todos los archivos (*.*)"
+        return _build_file_filter(tuple(self.supported_extensions))
     
     def _has_enough_disk_space(self, path, min_bytes=100*1024*1024):
         """Verifica si hay suficiente espacio libre en disco (por defecto 100MB)"""
@@ -134,13 +153,6 @@ class FileManager:
                 logger.warning("FFMPEG no encontrado, la importación de WAV podría fallar si no es estándar.")
 
         # Verificar espacio en disco (aproximado)
-        try:
-            # ... (código de verificación de espacio)
-        except OSError as e:
-            msg = f"Error al verificar espacio en disco: {e}"
-            logger.error(msg)
-            raise FileProcessingError(msg) from e
-
         if not self._has_enough_space(file_path):
             msg = "Espacio en disco insuficiente para importar archivo"
             logger.error(msg)
@@ -211,12 +223,44 @@ class FileManager:
             # Envolver en FileProcessingError
             raise FileProcessingError(f"Error inesperado al importar: {e}") from e
 
-    def export_transcription(self, transcription: TranscriptionResult, output_path: str, format: str):
+    def export_transcription_multi(self, transcription: Dict[str, Any], path_base: str,
+                                   formats=None) -> Dict[str, str]:
+        """
+        Exporta la transcripción a varios formatos recorriendo los segmentos una vez.
+
+        Args:
+            transcription (dict): Resultado de transcripción de Whisper.
+            path_base (str): Ruta base para los archivos de salida (sin extensión).
+            formats (list, optional): Formatos a generar. Si es None, se usan
+                los de la configuración ('export_formats').
+
+        Returns:
+            dict: {formato: ruta} de los archivos generados.
+
+        Raises:
+            FileProcessingError: Si la transcripción está vacía o no se pudo escribir.
+        """
+        if not transcription or not transcription.get("segments"):
+            msg = "Transcripción vacía, no se puede exportar"
+            logger.error(msg)
+            raise FileProcessingError(msg)
+
+        if formats is None:
+            formats = self.config.get("export_formats", ["txt", "srt", "vtt"])
+
+        with self._write_lock:
+            exported = text_utils.save_formats(transcription, path_base, formats)
+
+        if not exported:
+            raise FileProcessingError(f"No se pudo exportar la transcripción a {path_base}")
+        return exported
+
+    def export_transcription(self, transcription: TranscriptionModel, output_path: str, format: str):
         """
         Exporta la transcripción a un formato específico.
 
         Args:
-            transcription (TranscriptionResult): Objeto con los datos de la transcripción.
+            transcription (TranscriptionModel): Objeto con los datos de la transcripción.
             output_path (str): Ruta base para el archivo de salida (sin extensión).
             format (str): Formato de exportación ('txt', 'srt', 'vtt', 'json').
 
@@ -256,7 +300,8 @@ class FileManager:
 
         try:
             exporter = getattr(text_utils, f"export_to_{format}")
-            exporter(transcription, output_file)
+            with self._write_lock:
+                exporter(transcription, output_file)
 
             logger.info(f"Transcripción exportada exitosamente a {output_file}")
             self.signals.status_update.emit(f"Exportado a {format.upper()}")
@@ -39,12 +39,60 @@ class RealtimeTranscriber:
         self.signals = RealtimeTranscriberSignals()
         self.audio_queue = queue.Queue()
         self.audio_buffer = np.array([], dtype=np.float32)
+        # Fragmentos recibidos desde el hilo de audio, pendientes de unir al buffer
+        self.pending_chunks = []
+        self.chunk_lock = threading.Lock()
         self.window_size = 4.0  # segundos
         self.step_size = 2.0  # segundos
         self.sample_rate = 16000
         self.is_active = False
         self.processing_thread = None
         self.accumulated_text = ""
+        # Serializa el uso del modelo entre el precalentamiento y el dictado
+        self.model_lock = threading.Lock()
+        self.warmup_thread = None
+
+    def _transcribe_options(self):
+        """
+        Opciones de Whisper para los fragmentos en tiempo real
+        Returns:
+            dict: Opciones para model.transcribe
+        """
+        return {
+            "task": "transcribe",
+            "language": self.config.get("language"), # Usar el idioma configurado globalmente
+            "beam_size": 1, # Optimizado para velocidad en tiempo real
+            "best_of": 1,
+            "temperature": 0.0, # Más determinista
+            "fp16": self.config.get("fp16", True) # Usar fp16 si está configurado
+            # Considerar añadir 'prompt' o 'prefix' si se quiere guiar la transcripción
+            # "prompt": self.accumulated_text[-50:] # Ejemplo: usar las últimas 50 chars como prompt
+        }
+
+    def warm_up(self):
+        """
+        Precalienta el modelo en un hilo de fondo con un segundo de silencio
+        para que el primer fragmento dictado no pague la inicialización
+        (kernels, filtros mel, cachés del dispositivo)
+        """
+        if not self.transcriber.model or self.warmup_thread is not None:
+            return
+        self.warmup_thread = threading.Thread(target=self._warm_up_model)
+        self.warmup_thread.daemon = True
+        self.warmup_thread.start()
+
+    def _warm_up_model(self):
+        """Ejecuta una pasada de inferencia descartable"""
+        model = self.transcriber.model
+        if not model:
+            return
+        silence = np.zeros(self.sample_rate, dtype=np.float32)
+        try:
+            with self.model_lock:
+                model.transcribe(silence, **self._transcribe_options())
+            logger.info("Modelo precalentado para dictado en tiempo real")
+        except Exception as e:
+            logger.warning(f"No se pudo precalentar el modelo: {e}")
 
     def start(self):
         """Inicia el procesamiento en tiempo real"""
@@ -56,6 +104,8 @@ class RealtimeTranscriber:
             self.signals.error.emit("No hay modelo cargado para transcripción en tiempo real")
             return
         self.audio_buffer = np.array([], dtype=np.float32)
+        with self.chunk_lock:
+            self.pending_chunks = []
         self.accumulated_text = ""
         self.is_active = True
         self.processing_thread = threading.Thread(target=self._processing_loop)
@@ -71,6 +121,7 @@ class RealtimeTranscriber:
         if self.processing_thread:
             self.processing_thread.join(timeout=1.0)
             self.processing_thread = None
+        self._drain_chunks()
         if len(self.audio_buffer) > 0.5 * self.sample_rate:
             final_text = self._process_buffer(final=True)
             self.signals.finished.emit(final_text)
@@ -81,6 +132,9 @@ class RealtimeTranscriber:
     def add_audio_chunk(self, audio_chunk):
         """
         Añade un fragmento de audio al buffer
+        
+        Puede llamarse directamente desde el hilo de captura de audio: solo
+        encola el fragmento y el hilo de procesamiento lo une al buffer.
         Args:
             audio_chunk (np.ndarray): Fragmento de audio
         """
@@ -88,12 +142,22 @@ class RealtimeTranscriber:
             return
         if audio_chunk.dtype != np.float32:
             audio_chunk = audio_chunk.astype(np.float32) / 32768.0
-        self.audio_buffer = np.append(self.audio_buffer, audio_chunk)
+        with self.chunk_lock:
+            self.pending_chunks.append(audio_chunk)
+
+    def _drain_chunks(self):
+        """Une al buffer de audio los fragmentos pendientes en una sola copia"""
+        with self.chunk_lock:
+            chunks = self.pending_chunks
+            self.pending_chunks = []
+        if chunks:
+            self.audio_buffer = np.concatenate([self.audio_buffer] + chunks)
 
     def _processing_loop(self):
         """Bucle principal de procesamiento"""
         last_process_time = time.time()
         while self.is_active:
+            self._drain_chunks()
             current_time = time.time()
             buffer_duration = len(self.audio_buffer) / self.sample_rate
             if (buffer_duration >= self.window_size and 
@@ -144,16 +208,7 @@ class RealtimeTranscriber:
 
             # Transcribir directamente desde el array numpy
             try:
-                options = {
-                    "task": "transcribe",
-                    "language": self.config.get("language"), # Usar el idioma configurado globalmente
-                    "beam_size": 1, # Optimizado para velocidad en tiempo real
-                    "best_of": 1,
-                    "temperature": 0.0, # Más determinista
-                    "fp16": self.config.get("fp16", True) # Usar fp16 si está configurado
-                    # Considerar añadir 'prompt' o 'prefix' si se quiere guiar la transcripción
-                    # "prompt": self.accumulated_text[-50:] # Ejemplo: usar las últimas 50 chars como prompt
-                }
+                options = self._transcribe_options()
                 # Asegurar que el modelo está disponible
                 if not self.transcriber or not self.transcriber.model:
                     logger.error("Modelo no disponible para transcripción en tiempo real.")
@@ -161,7 +216,8 @@ class RealtimeTranscriber:
                     return self.accumulated_text
 
                 # Ejecutar transcripción
-                result = self.transcriber.model.transcribe(audio_to_process, **options)
+                with self.model_lock:
+                    result = self.transcriber.model.transcribe(audio_to_process, **options)
 
                 new_text = result["text"].strip()
                 logger.debug(f"Realtime chunk processed. New text: '{new_text}'")
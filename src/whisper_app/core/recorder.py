@@ -313,8 +313,8 @@ class AudioRecorder(QObject):
 
                 if self.is_recording and self.is_streaming:
                     # Emitir señal con el fragmento actual para procesamiento en tiempo real
-                    # Asegurarse que es un array numpy plano
-                    audio_chunk = indata.flatten().copy()
+                    # flatten() ya devuelve una copia plana del buffer de entrada
+                    audio_chunk = indata.flatten()
                     self.signals.recording_chunk.emit(audio_chunk)
 
                     # Calcular y emitir nivel de audio
@@ -10,7 +10,6 @@ import tempfile
 import math
 import time
 import subprocess
-import whisper
 from PyQt5.QtCore import QObject, pyqtSignal
 
 # Añadir importación directa de verify_ffmpeg
@@ -20,6 +19,49 @@ from whisper_app.utils.paths import MODELS_DIR, get_model_path
 
 logger = logging.getLogger(__name__)
 
+# Campos de segmento que la aplicación usa (el resto son datos de decodificación)
+SEGMENT_FIELDS = ("id", "start", "end", "text", "words")
+
+
+def model_download_root(config_manager):
+    """
+    Directorio en el que Whisper guarda los modelos descargados
+    
+    Args:
+        config_manager: Instancia de ConfigManager
+        
+    Returns:
+        str: Ruta del directorio de modelos
+    """
+    cache_dir = config_manager.get("model_cache_dir", "") or MODELS_DIR
+    return os.path.join(cache_dir, "whisper")
+
+
+def is_model_cached(model_name, config_manager):
+    """
+    Indica si un modelo ya está descargado, sin crear un Transcriber
+    
+    El nombre del archivo se toma de la URL del modelo, ya que Whisper guarda
+    algunos con nombre versionado (p.ej. "large" como large-v2.pt). Importa
+    whisper, por lo que conviene llamarla fuera del hilo de la interfaz.
+    
+    Args:
+        model_name (str): Nombre del modelo
+        config_manager: Instancia de ConfigManager
+        
+    Returns:
+        bool: True si el archivo del modelo existe localmente
+    """
+    try:
+        import whisper
+    except ImportError:
+        return False
+    url = getattr(whisper, "_MODELS", {}).get(model_name)
+    if url is None:
+        return False
+    path = os.path.join(model_download_root(config_manager), os.path.basename(url))
+    return os.path.isfile(path)
+
 class TranscriptionSignals(QObject):
     """Señales para comunicación durante el proceso de transcripción"""
     progress = pyqtSignal(int, str)  # valor, mensaje
@@ -41,22 +83,28 @@ class Transcriber(QObject):
         self.config = config_manager
         self.model = None
         self.current_model_name = None
+        self.load_error = None  # Mensaje del último fallo de load_model
         self.cancel_requested = False
         self.signals = TranscriptionSignals()
     
-    def load_model(self, model_name=None):
+    def load_model(self, model_name=None, quiet=False):
         """
         Carga el modelo de Whisper
         
+        Los fallos no se emiten como error de transcripción: el mensaje queda
+        en load_error para que quien pidió la carga decida cómo informarlo.
+        
         Args:
             model_name (str, optional): Nombre del modelo a cargar.
                 Si es None, se utiliza el de la configuración.
+            quiet (bool): Si es True no se emite progreso (cargas en segundo plano)
         
         Returns:
             bool: True si se cargó correctamente, False en caso contrario
         """
         if model_name is None:
             model_name = self.config.get("model_size", "base")
+        self.load_error = None
         
         # Si el modelo ya está cargado, no hacer nada
         if self.model is not None and self.current_model_name == model_name:
@@ -65,7 +113,8 @@ class Transcriber(QObject):
         
         try:
             logger.info(f"Cargando modelo '{model_name}'...")
-            self.signals.progress.emit(10, f"Cargando modelo '{model_name}'...")
+            if not quiet:
+                self.signals.progress.emit(10, f"Cargando modelo '{model_name}'...")
             
             # Liberar memoria si hay un modelo anterior
             if self.model is not None:
@@ -82,23 +131,58 @@ class Transcriber(QObject):
                 
             logger.debug(f"Directorio de caché para modelos: {os.environ['XDG_CACHE_HOME']}")
             
-            # Cargar el nuevo modelo
+            # Cargar el nuevo modelo (whisper/torch se importan solo al necesitarlos)
+            import whisper
             fp16 = self.config.get("fp16", True)
             self.model = whisper.load_model(model_name, fp16=fp16)
             self.current_model_name = model_name
             
-            self.signals.progress.emit(100, f"Modelo '{model_name}' cargado con éxito")
+            if not quiet:
+                self.signals.progress.emit(100, f"Modelo '{model_name}' cargado con éxito")
             logger.info(f"Modelo '{model_name}' cargado con éxito")
             return True
             
         except Exception as e:
             self.model = None
             self.current_model_name = None
-            error_msg = f"Error al cargar modelo '{model_name}': {e}"
-            logger.error(error_msg)
-            self.signals.error.emit(error_msg)
+            self.load_error = f"Error al cargar modelo '{model_name}': {e}"
+            logger.error(self.load_error)
             return False
     
+    def is_model_cached(self, model_name):
+        """
+        Indica si un modelo ya está descargado en el directorio de caché
+        
+        Args:
+            model_name (str): Nombre del modelo
+            
+        Returns:
+            bool: True si el archivo del modelo existe localmente
+        """
+        return is_model_cached(model_name, self.config)
+    
+    @staticmethod
+    def compact_result(result):
+        """
+        Reduce los segmentos de un resultado de Whisper a los campos usados
+        
+        Los tokens y métricas de cada segmento ocupan más memoria que el texto
+        y no se usan para mostrar, exportar ni guardar en caché.
+        
+        Args:
+            result (dict): Resultado de Whisper (se modifica en el sitio)
+            
+        Returns:
+            dict: El mismo resultado
+        """
+        segments = result.get("segments")
+        if segments:
+            result["segments"] = [
+                {key: segment[key] for key in SEGMENT_FIELDS if key in segment}
+                for segment in segments
+            ]
+        return result
+    
     def transcribe_file(self, file_path, language=None, translate_to=None):
         """
         Transcribe un archivo de audio/video
@@ -131,6 +215,7 @@ class Transcriber(QObject):
         # Verificar que el modelo está cargado
         if self.model is None:
             if not self.load_model():
+                self.signals.error.emit(self.load_error or "No se pudo cargar el modelo")
                 return None
         
         # Estimar tiempo basado en duración y modelo
@@ -241,6 +326,9 @@ class Transcriber(QObject):
                 
                 self.signals.progress.emit(95, "Traducción completada")
             
+            # Descartar tokens y métricas de decodificación de cada segmento
+            self.compact_result(result)
+            
             # Emitir resultado
             output = {
                 "result": result,
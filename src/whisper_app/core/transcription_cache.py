@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Caché persistente de transcripciones para WhisperApp
+"""
+
+import os
+import json
+import mmap
+import hashlib
+import logging
+from typing import Optional, Dict, Any
+
+from whisper_app.utils.paths import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Variable de entorno para desactivar la caché (p.ej. WHISPERAPP_NO_CACHE=1)
+NO_CACHE_ENV = "WHISPERAPP_NO_CACHE"
+
+
+def compute_audio_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Calcula el hash SHA-256 de un archivo de audio
+
+    El archivo se proyecta en memoria con mmap y se procesa por bloques de
+    ``chunk_size`` bytes; hashlib libera el GIL con bloques de ese tamaño, por
+    lo que puede ejecutarse en un hilo sin bloquear la interfaz.
+
+    Args:
+        file_path (str): Ruta al archivo
+        chunk_size (int): Tamaño de bloque en bytes
+
+    Returns:
+        str: Hash hexadecimal del contenido
+    """
+    sha256 = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # mmap no admite archivos vacíos
+            return sha256.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                for offset in range(0, size, chunk_size):
+                    sha256.update(view[offset:offset + chunk_size])
+            finally:
+                view.release()
+    return sha256.hexdigest()
+
+
+class TranscriptionCache:
+    """Almacena resultados de transcripción en disco para evitar repetir Whisper"""
+
+    def __init__(self, config_manager, cache_dir=None):
+        """
+        Inicializa la caché de transcripciones
+
+        Args:
+            config_manager: Instancia de ConfigManager
+            cache_dir (str, optional): Directorio de la caché.
+                Si es None, se usa CACHE_DIR/transcripts.
+        """
+        self.config = config_manager
+        self.cache_dir = cache_dir or os.path.join(CACHE_DIR, "transcripts")
+
+    @property
+    def enabled(self) -> bool:
+        """Indica si la caché está activa"""
+        return os.environ.get(NO_CACHE_ENV, "") != "1"
+
+    @staticmethod
+    def make_key(audio_hash: str, model_name: str, language: Optional[str] = None,
+                 translate_to: Optional[str] = None) -> str:
+        """
+        Construye la clave de caché para una transcripción
+
+        Args:
+            audio_hash (str): Hash SHA-256 del audio procesado
+            model_name (str): Nombre del modelo Whisper
+            language (str, optional): Código del idioma de origen
+            translate_to (str, optional): Código del idioma de traducción
+
+        Returns:
+            str: Clave hexadecimal
+        """
+        parts = (audio_hash, model_name or "", language or "auto", translate_to or "")
+        return hashlib.sha256("|".join(parts).encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene un resultado almacenado
+
+        Args:
+            key (str): Clave de caché
+
+        Returns:
+            dict: Resultado de la transcripción o None si no existe o está dañado
+        """
+        if not self.enabled:
+            return None
+
+        path = self._entry_path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+            # Actualizar fecha de acceso para la política LRU
+            os.utime(path, None)
+            logger.info(f"Transcripción recuperada de la caché: {key}")
+            return result
+        except (json.JSONDecodeError, IOError, OSError) as e:
+            logger.warning(f"Entrada de caché dañada ({path}), se volverá a transcribir: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]) -> bool:
+        """
+        Guarda un resultado de forma atómica
+
+        Args:
+            key (str): Clave de caché
+            result (dict): Resultado de la transcripción
+
+        Returns:
+            bool: True si se guardó correctamente
+        """
+        if not self.enabled:
+            return False
+
+        path = self._entry_path(key)
+        temp_path = path + ".tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, default=str)
+            os.replace(temp_path, path)
+        except (TypeError, ValueError, IOError, OSError) as e:
+            logger.warning(f"No se pudo guardar la transcripción en caché: {e}")
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return False
+
+        self._evict()
+        return True
+
+    def _evict(self):
+        """Elimina las entradas menos usadas si se supera cache_max_mb"""
+        max_bytes = self.config.get("cache_max_mb", 500) * 1024 * 1024
+        try:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError as e:
+            logger.warning(f"No se pudo inspeccionar la caché de transcripciones: {e}")
+            return
+
+        if total <= max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+                total -= size
+                logger.debug(f"Entrada de caché eliminada: {path}")
+            except OSError as e:
+                logger.warning(f"No se pudo eliminar entrada de caché {path}: {e}")
+            if total <= max_bytes:
+                break
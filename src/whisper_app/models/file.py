@@ -7,6 +7,8 @@ Modelo para representar archivos multimedia
 import os
 from datetime import datetime
 
+from whisper_app.utils.text_utils import format_file_size
+
 class FileModel:
     """Representa un archivo multimedia en la aplicación"""
     
@@ -43,12 +45,7 @@ class FileModel:
     
     def format_size(self):
         """Formatea el tamaño del archivo a una representación legible"""
-        size = self.size
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} GB"
+        return format_file_size(self.size)
     
     def format_duration(self):
         """Formatea la duración a una representación legible"""
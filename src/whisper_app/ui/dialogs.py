@@ -9,6 +9,10 @@ import sys
 import logging
 import tempfile
 import shutil
+import hashlib
+import zlib
+import threading
+import urllib.request
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -16,15 +20,39 @@ from PyQt5.QtWidgets import (
     QWidget, QGroupBox, QFileDialog, QDialogButtonBox,
     QLineEdit, QListWidget, QListWidgetItem, QRadioButton,
     QFormLayout, QGridLayout, QSlider, QMessageBox, QProgressDialog,
-    QApplication, QTextEdit, QToolButton, QFrame, QStyle
+    QApplication, QTextEdit, QPlainTextEdit, QToolButton, QFrame, QStyle,
+    QProgressBar, QLayout
 )
-from PyQt5.QtCore import Qt, QSize, QUrl, QThread, pyqtSignal, QSettings, QTimer
-from PyQt5.QtGui import QIcon, QPixmap, QDesktopServices, QFont, QColor, QPalette
+from PyQt5.QtCore import (
+    Qt, QSize, QUrl, QThread, pyqtSignal, pyqtSlot, QSettings, QTimer, QObject,
+    QRunnable, QThreadPool, QMetaObject, Q_ARG
+)
+from PyQt5.QtGui import QIcon, QPixmap, QDesktopServices, QFont, QColor, QPalette, QTextCursor
 
 from whisper_app.utils.ffmpeg_utils import verify_ffmpeg, find_ffmpeg
+from whisper_app.utils.paths import MODELS_DIR
+from whisper_app.utils.text_utils import format_file_size
 
 logger = logging.getLogger(__name__)
 
+_BOLD_FONT = None
+
+
+def _bold_font():
+    """
+    Obtiene una fuente en negrita compartida entre diálogos
+    
+    Se crea de forma perezosa porque QFont necesita una QApplication activa.
+    
+    Returns:
+        QFont: Fuente predeterminada en negrita
+    """
+    global _BOLD_FONT
+    if _BOLD_FONT is None:
+        _BOLD_FONT = QFont()
+        _BOLD_FONT.setBold(True)
+    return _BOLD_FONT
+
 class ConfigDialog(QDialog):
     """Diálogo de configuración general"""
     
@@ -393,16 +421,7 @@ class ConfigDialog(QDialog):
                         count += 1
             
             # Convertir a formato legible
-            if total_size > 1024 * 1024 * 1024:
-                size_str = f"{total_size / (1024 * 1024 * 1024):.2f} GB"
-            elif total_size > 1024 * 1024:
-                size_str = f"{total_size / (1024 * 1024):.2f} MB"
-            elif total_size > 1024:
-                size_str = f"{total_size / 1024:.2f} KB"
-            else:
-                size_str = f"{total_size} bytes"
-            
-            self.cache_info_label.setText(f"{count} archivos ({size_str})")
+            self.cache_info_label.setText(f"{count} archivos ({format_file_size(total_size)})")
             
         except Exception as e:
             logger.warning(f"Error al calcular tamaño de caché: {e}")
@@ -1532,6 +1551,8 @@ class AboutDialog(QDialog):
 class ErrorReportDialog(QDialog):
     """Diálogo para reportar errores"""
     
+    TRACE_BATCH_LINES = 200  # Líneas de traza insertadas por iteración del bucle de eventos
+    
     def __init__(self, error_msg, trace=None, parent=None):
         """
         Inicializa el diálogo de reporte de errores
@@ -1542,53 +1563,59 @@ class ErrorReportDialog(QDialog):
             parent: Widget padre
         """
         super().__init__(parent)
+        self.setAttribute(Qt.WA_DeleteOnClose)
         
         self.setWindowTitle("Error")
         self.resize(600, 400)
         
         self.error_msg = error_msg
-        self.trace = trace
-        
+        # La traza se guarda comprimida y se descomprime solo al mostrarla o copiarla
+        self._trace_compressed = zlib.compress(trace.encode('utf-8'), 1) if trace else None
+        self._trace_widget = None
+        self._trace_lines = None
+        self._trace_index = 0
+        self._copy_btn = None
+
         self.setup_ui()
     
+    @property
+    def trace(self):
+        """Traza completa del error (descomprimida bajo demanda)"""
+        if not self._trace_compressed:
+            return None
+        return zlib.decompress(self._trace_compressed).decode('utf-8')
+    
     def setup_ui(self):
         """Configura la interfaz del diálogo"""
+        # Agrupar la construcción en un único repintado
+        self.setUpdatesEnabled(False)
+        
         layout = QVBoxLayout(self)
         
-        # Icono de error
-        icon_layout = QHBoxLayout()
+        # Icono y mensaje de error en una sola fila
+        header_grid = QGridLayout()
         icon_label = QLabel()
         icon_label.setPixmap(self.style().standardIcon(QStyle.SP_MessageBoxCritical).pixmap(48, 48))
-        icon_layout.addWidget(icon_label)
+        header_grid.addWidget(icon_label, 0, 0)
         
         # Mensaje de error
         error_label = QLabel(self.error_msg)
         error_label.setWordWrap(True)
-        error_label.setTextFormat(Qt.RichText)
-        font = error_label.font()
-        font.setBold(True)
-        error_label.setFont(font)
-        icon_layout.addWidget(error_label, 1)
+        error_label.setTextFormat(Qt.PlainText)
+        error_label.setFont(_bold_font())
+        header_grid.addWidget(error_label, 0, 1)
+        header_grid.setColumnStretch(1, 1)
         
-        layout.addLayout(icon_layout)
+        layout.addLayout(header_grid)
         
-        if self.trace:
-            # Detalles técnicos
+        if self._trace_compressed:
+            # Detalles técnicos (el contenido se construye al expandir el grupo)
             details_group = QGroupBox("Detalles técnicos")
-            details_layout = QVBoxLayout(details_group)
-            
-            trace_text = QTextEdit()
-            trace_text.setReadOnly(True)
-            trace_text.setLineWrapMode(QTextEdit.NoWrap)
-            trace_text.setPlainText(self.trace)
-            
-            details_layout.addWidget(trace_text)
-            
-            # Botón para copiar
-            copy_btn = QPushButton("Copiar al portapapeles")
-            copy_btn.clicked.connect(lambda: self.copy_to_clipboard(self.trace))
-            details_layout.addWidget(copy_btn)
-            
+            details_group.setCheckable(True)
+            details_group.setChecked(False)
+            self.details_layout = QVBoxLayout(details_group)
+            details_group.toggled.connect(self.toggle_details)
+
             layout.addWidget(details_group)
         
         # Acciones sugeridas
@@ -1612,10 +1639,64 @@ class ErrorReportDialog(QDialog):
         button_box = QDialogButtonBox(QDialogButtonBox.Ok)
         button_box.accepted.connect(self.accept)
         layout.addWidget(button_box)
+        
+        self.setUpdatesEnabled(True)
+        self.update()
+
+    def toggle_details(self, checked):
+        """Muestra u oculta los detalles técnicos, creándolos en la primera expansión"""
+        if checked and self._trace_widget is None:
+            self._trace_widget = QPlainTextEdit()
+            self._trace_widget.setReadOnly(True)
+            self._trace_widget.setLineWrapMode(QPlainTextEdit.NoWrap)
+            self.details_layout.addWidget(self._trace_widget)
+            
+            # Insertar la traza por lotes para no bloquear el bucle de eventos
+            self._trace_lines = self.trace.split('\n')
+            self._trace_index = 0
+            self._append_next()
+
+            # Botón para copiar
+            self._copy_btn = QPushButton("Copiar al portapapeles")
+            self._copy_btn.clicked.connect(self._on_copy_clicked)
+            self.details_layout.addWidget(self._copy_btn)
+
+        if self._trace_widget is not None:
+            self._trace_widget.setVisible(checked)
+            self._copy_btn.setVisible(checked)
+
+    def _append_next(self):
+        """Añade el siguiente lote de líneas de la traza y programa el resto"""
+        if self._trace_widget is None or self._trace_lines is None:
+            return
+        end = self._trace_index + self.TRACE_BATCH_LINES
+        batch = '\n'.join(self._trace_lines[self._trace_index:end])
+        self._trace_widget.blockSignals(True)
+        self._trace_widget.appendPlainText(batch)
+        self._trace_widget.blockSignals(False)
+        self._trace_index = end
+        
+        if self._trace_index < len(self._trace_lines):
+            QTimer.singleShot(0, self._append_next)
+        else:
+            self._trace_lines = None
+            self._trace_widget.moveCursor(QTextCursor.Start)
+    
+    @pyqtSlot()
+    def _on_copy_clicked(self):
+        """Copia la traza completa al portapapeles"""
+        self.copy_to_clipboard(self.trace)
+    
+    @pyqtSlot(str)
+    def _do_copy(self, text):
+        """Escribe el texto en el portapapeles del sistema si aún no lo contiene"""
+        clipboard = QApplication.clipboard()
+        if clipboard.text() != text:
+            clipboard.setText(text)
     
     def copy_to_clipboard(self, text):
-        """Copia texto al portapapeles"""
-        QApplication.clipboard().setText(text)
+        """Copia texto al portapapeles en la siguiente iteración del bucle de eventos"""
+        QMetaObject.invokeMethod(self, "_do_copy", Qt.QueuedConnection, Q_ARG(str, text))
         
         # Mostrar confirmación brevemente
         msg = QMessageBox(self)
@@ -1628,6 +1709,136 @@ class ErrorReportDialog(QDialog):
         QTimer.singleShot(1500, msg.close)
 
 
+# Pool propio para descargas de modelos: reutiliza hilos entre diálogos sin
+# alterar el pool global que usan las tareas de hash y exportación
+MAX_CONCURRENT_DOWNLOADS = min(6, os.cpu_count() or 1)
+_DOWNLOAD_POOL = None
+_active_downloads = set()
+
+
+def get_download_pool():
+    """
+    Obtiene el QThreadPool dedicado a las descargas de modelos
+    
+    Returns:
+        QThreadPool: Pool limitado a MAX_CONCURRENT_DOWNLOADS hilos
+    """
+    global _DOWNLOAD_POOL
+    if _DOWNLOAD_POOL is None:
+        _DOWNLOAD_POOL = QThreadPool()
+        _DOWNLOAD_POOL.setMaxThreadCount(MAX_CONCURRENT_DOWNLOADS)
+    return _DOWNLOAD_POOL
+
+
+class WorkerSignals(QObject):
+    """Señales de un trabajador ejecutado en el pool de hilos"""
+    progress = pyqtSignal(int, str)  # porcentaje, mensaje
+    complete = pyqtSignal(str)  # ruta del modelo descargado
+    error = pyqtSignal(str)  # mensaje de error
+
+
+class DownloadWorker(QRunnable):
+    """Descarga los pesos de un modelo Whisper informando del progreso real"""
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, model_name, download_root):
+        """
+        Inicializa el trabajador de descarga
+        
+        Args:
+            model_name (str): Nombre del modelo a descargar
+            download_root (str): Directorio donde guardar el modelo
+        """
+        super().__init__()
+        self.model_name = model_name
+        self.download_root = download_root
+        self.cancel_event = threading.Event()
+        self.signals = WorkerSignals()
+    
+    def cancel(self):
+        """Solicita la cancelación de la descarga en curso"""
+        self.cancel_event.set()
+    
+    def run(self):
+        """Ejecuta la descarga y libera la referencia al terminar"""
+        try:
+            self._download()
+        finally:
+            _active_downloads.discard(self)
+    
+    def _download(self):
+        """Descarga el modelo por bloques emitiendo el progreso"""
+        try:
+            import whisper
+            url = whisper._MODELS[self.model_name]
+        except KeyError:
+            self.signals.error.emit(f"Modelo desconocido: {self.model_name}")
+            return
+        except Exception as e:
+            self.signals.error.emit(f"No se pudo obtener la URL del modelo: {e}")
+            return
+        
+        expected_sha256 = url.split("/")[-2]
+        target = os.path.join(self.download_root, os.path.basename(url))
+        
+        if os.path.isfile(target):
+            self.signals.progress.emit(100, "Modelo ya disponible en caché")
+            self.signals.complete.emit(target)
+            return
+        
+        partial = target + ".part"
+        sha256 = hashlib.sha256()
+        try:
+            os.makedirs(self.download_root, exist_ok=True)
+            with urllib.request.urlopen(url) as source, open(partial, "wb") as output:
+                total = int(source.info().get("Content-Length", 0))
+                received = 0
+                last_percent = -1
+                while True:
+                    if self.cancel_event.is_set():
+                        break
+                    buffer = source.read(self.CHUNK_SIZE)
+                    if not buffer:
+                        break
+                    output.write(buffer)
+                    sha256.update(buffer)
+                    received += len(buffer)
+                    if total:
+                        # Emitir solo cuando cambia el porcentaje, no por cada bloque
+                        percent = received * 100 // total
+                        if percent == last_percent:
+                            continue
+                        last_percent = percent
+                        self.signals.progress.emit(
+                            percent,
+                            f"Descargando... {received / 1024**2:.1f} / {total / 1024**2:.1f} MB"
+                        )
+            
+            if self.cancel_event.is_set():
+                os.unlink(partial)
+                logger.info(f"Descarga del modelo '{self.model_name}' cancelada")
+                return
+            
+            if sha256.hexdigest() != expected_sha256:
+                os.unlink(partial)
+                self.signals.error.emit("El archivo descargado no supera la verificación SHA256")
+                return
+            
+            os.replace(partial, target)
+            self.signals.progress.emit(100, "¡Descarga completada!")
+            self.signals.complete.emit(target)
+        
+        except Exception as e:
+            logger.error(f"Error al descargar modelo '{self.model_name}': {e}")
+            if os.path.exists(partial):
+                try:
+                    os.unlink(partial)
+                except OSError:
+                    pass
+            self.signals.error.emit(f"Error al descargar modelo: {e}")
+
+
 class ModelDownloadDialog(QDialog):
     """Diálogo para gestionar la descarga de modelos"""
     
@@ -1636,28 +1847,47 @@ class ModelDownloadDialog(QDialog):
     download_complete = pyqtSignal(str)
     download_error = pyqtSignal(str)
     
-    def __init__(self, model_name, parent=None):
+    # Mensaje de estado habitual más largo; fija el ancho de la etiqueta de estado
+    STATUS_WIDTH_SAMPLE = "El archivo descargado no supera la verificación SHA256"
+    
+    def __init__(self, model_name, parent=None, download_root=None):
         """
         Inicializa el diálogo de descarga de modelos
         
         Args:
             model_name (str): Nombre del modelo a descargar
             parent: Widget padre
+            download_root (str, optional): Directorio de descarga. Si es None,
+                se usa la caché de modelos de Whisper.
         """
         super().__init__(parent)
+        self.setAttribute(Qt.WA_DeleteOnClose)
         
         self.model_name = model_name
         self.download_path = ""
+        self.download_root = download_root or os.path.join(
+            os.environ.get("XDG_CACHE_HOME", MODELS_DIR), "whisper"
+        )
+        self.worker = None
+        self.cancelled = False  # Seguimiento de cancelación
         
         self.setWindowTitle(f"Descargando modelo {model_name}")
-        self.setFixedSize(400, 200)
         self.setModal(True)
         
         self.setup_ui()
+        
+        self.download_progress.connect(self._on_progress)
+        # Al completar la descarga el diálogo sigue abierto mientras se carga
+        # el modelo; lo cierra quien lanzó la carga
+        self.download_complete.connect(self._on_complete)
+        self.download_error.connect(self._on_error)
     
     def setup_ui(self):
         """Configura la interfaz del diálogo"""
         layout = QVBoxLayout(self)
+        # Tamaño fijo calculado una sola vez: las actualizaciones de progreso
+        # no provocan un recálculo de la geometría del diálogo
+        layout.setSizeConstraint(QLayout.SetFixedSize)
         
         # Información
         info_label = QLabel(f"Descargando modelo Whisper <b>{self.model_name}</b>")
@@ -1681,73 +1911,59 @@ class ModelDownloadDialog(QDialog):
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
+        self.progress_bar.setTextVisible(False)  # El estado ya se muestra en status_label
         layout.addWidget(self.progress_bar)
         
         # Estado
         self.status_label = QLabel("Iniciando descarga...")
         self.status_label.setAlignment(Qt.AlignCenter)
+        # Ancho fijo medido con la fuente actual para que los mensajes de
+        # progreso no redimensionen el diálogo; los más largos (errores) se ajustan
+        self.status_label.setWordWrap(True)
+        self.status_label.setFixedWidth(
+            self.status_label.fontMetrics().horizontalAdvance(self.STATUS_WIDTH_SAMPLE)
+            + 2 * self.status_label.margin()
+        )
         layout.addWidget(self.status_label)
         
         # Botones
         button_box = QDialogButtonBox(QDialogButtonBox.Cancel)
         button_box.rejected.connect(self.cancel_download)
         layout.addWidget(button_box)
-        
-        # Variable para seguimiento de cancelación
-        self.cancelled = False
     
     def start_download(self):
-        """Inicia la descarga del modelo"""
-        # La descarga real se maneja dentro de Whisper
-        # Este diálogo simula el progreso
-        
-        # Actualizar cada 0.5 segundos
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_progress)
-        self.current_progress = 0
-        self.timer.start(500)
+        """Inicia la descarga del modelo en el pool de hilos compartido"""
+        self.worker = DownloadWorker(self.model_name, self.download_root)
+        self.worker.signals.progress.connect(self.download_progress)
+        self.worker.signals.complete.connect(self.download_complete)
+        self.worker.signals.error.connect(self.download_error)
+        
+        _active_downloads.add(self.worker)
+        get_download_pool().start(self.worker)
     
-    def update_progress(self):
-        """Actualiza el progreso de la descarga simulada"""
-        if self.cancelled:
-            return
-        
-        # Simular progreso
-        if self.current_progress < 95:
-            # Incremento variable para simular velocidad de descarga
-            increment = 5 if self.current_progress < 50 else 2
-            self.current_progress += increment
-            
-            # Actualizar barra y etiqueta
-            self.progress_bar.setValue(self.current_progress)
-            
-            # Mensajes según el progreso
-            if self.current_progress < 30:
-                self.status_label.setText("Descargando archivos del modelo...")
-            elif self.current_progress < 60:
-                self.status_label.setText("Recibiendo datos...")
-            elif self.current_progress < 90:
-                self.status_label.setText("Verificando integridad...")
-            else:
-                self.status_label.setText("Finalizando descarga...")
-        else:
-            # Simular finalización
-            self.current_progress = 100
-            self.progress_bar.setValue(100)
-            self.status_label.setText("¡Descarga completada!")
-            self.timer.stop()
-            
-            # Simular descarga completada después de un breve retraso
-            QTimer.singleShot(1000, self.complete_download)
+    def _on_progress(self, percent, message):
+        """Actualiza la barra y la etiqueta con el progreso recibido"""
+        self.progress_bar.setValue(percent)
+        self.status_label.setText(message)
+    
+    def _on_complete(self, path):
+        """Registra el archivo descargado y pasa a la fase de carga"""
+        self.download_path = path
+        self.status_label.setText("Cargando modelo...")
     
-    def complete_download(self):
-        """Simula la finalización de la descarga"""
-        self.accept()
+    def _on_error(self, error_msg):
+        """Muestra el error de descarga y cierra el diálogo"""
+        self.status_label.setText("Error en la descarga")
+        QMessageBox.critical(self, "Error de descarga", error_msg)
+        self.reject()
     
     def cancel_download(self):
         """Cancela la descarga del modelo"""
+        if self.cancelled:
+            return
         self.cancelled = True
-        self.timer.stop()
+        if self.worker is not None:
+            self.worker.cancel()
         self.reject()
 
 def get_ffmpeg_install_instructions():
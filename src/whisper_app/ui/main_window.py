@@ -5,20 +5,28 @@ Ventana principal de WhisperApp
 """
 
 import os
+import html
+import time
 import logging
 import tempfile
+from collections import OrderedDict
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QLabel, QPushButton, QComboBox, QListWidget, QListWidgetItem,
-    QProgressBar, QTextEdit, QMessageBox, QFileDialog, QAction,
-    QMenu, QStatusBar, QToolBar, QCheckBox, QShortcut, QApplication
+    QLabel, QPushButton, QComboBox, QListWidget,
+    QProgressBar, QTextEdit, QPlainTextEdit, QMessageBox, QFileDialog, QAction,
+    QMenu, QStatusBar, QToolBar, QCheckBox, QShortcut, QDialog
+)
+from PyQt5.QtCore import (
+    Qt, QSize, QTimer, pyqtSlot, pyqtSignal, QObject, QRunnable, QThreadPool
+)
+from PyQt5.QtGui import (
+    QIcon, QTextCursor, QKeySequence, QTextDocument, QPalette, QColor,
+    QStandardItemModel, QStandardItem
 )
-from PyQt5.QtCore import Qt, QSize, QThread, pyqtSlot, pyqtSignal, QObject
-from PyQt5.QtGui import QIcon, QTextCursor, QKeySequence
 
-from whisper_app.core.transcriber import Transcriber
-from whisper_app.core.recorder import AudioRecorder
+from whisper_app.core.transcriber import Transcriber, is_model_cached, model_download_root
 from whisper_app.core.file_manager import FileManager
+from whisper_app.core.transcription_cache import TranscriptionCache, compute_audio_hash
 from whisper_app.ui.dialogs import (
     ConfigDialog, 
     AudioDeviceDialog, 
@@ -27,86 +35,281 @@ from whisper_app.ui.dialogs import (
     ModelDownloadDialog,
     get_ffmpeg_install_instructions
 )
-from whisper_app.utils.ffmpeg_utils import verify_ffmpeg, verify_ffmpeg_components
-from whisper_app.utils.text_utils import extract_keywords
-from whisper_app.utils.language_data import get_stopwords
-from whisper_app.core.realtime_transcriber import RealtimeTranscriber
+from whisper_app.utils.ffmpeg_utils import verify_ffmpeg, verify_ffmpeg_components, reset_ffmpeg_check
+from whisper_app.utils.text_utils import (
+    transcription_keywords, count_words, format_file_size, EXPORT_BUFFER_SIZE
+)
 
 from whisper_app.utils.dependencies import import_optional
 psutil = import_optional("psutil")
 
 logger = logging.getLogger(__name__)
 
-class TranscriptionThread(QThread):
-    """Hilo para ejecutar la transcripción en segundo plano"""
+class TranscriptionTaskSignals(QObject):
+    """Señales de una tarea de transcripción ejecutada en el pool"""
+    finished = pyqtSignal(dict)  # resultado
+    done = pyqtSignal()  # la tarea terminó (con o sin resultado)
+
+class TranscriptionTask(QRunnable):
+    """Tarea para ejecutar la transcripción en segundo plano"""
     
-    def __init__(self, transcriber, file_info, language, translate_to):
+    def __init__(self, transcriber, file_info, language, translate_to, cache=None, cache_key=None):
         super().__init__()
         self.transcriber = transcriber
         self.file_info = file_info
         self.language = language
         self.translate_to = translate_to
+        self.cache = cache
+        self.cache_key = cache_key
+        self.signals = TranscriptionTaskSignals()
     
     def run(self):
         """Ejecuta la transcripción"""
-        self.transcriber.transcribe_file(
-            self.file_info['processed_path'],
-            self.language,
-            self.translate_to
-        )
+        try:
+            result = self.transcriber.transcribe_file(
+                self.file_info['processed_path'],
+                self.language,
+                self.translate_to
+            )
+            # Los errores y cancelaciones se notifican por transcriber.signals
+            if result is not None:
+                # Extraer palabras clave y guardar en caché aquí para no bloquear la interfaz
+                result["keywords"] = transcription_keywords(result["result"])
+                if self.cache_key:
+                    self.cache.put(self.cache_key, result)
+                self.signals.finished.emit(result)
+        finally:
+            self.signals.done.emit()
 
-class ModelLoaderThread(QThread):
-    finished = pyqtSignal(bool, str)
-    progress = pyqtSignal(int, str)
+class ExportTaskSignals(QObject):
+    """Señales de una tarea de exportación"""
+    finished = pyqtSignal(dict, str, list)  # archivos exportados, ruta base, formatos
+    error = pyqtSignal(str)  # mensaje de error
+    done = pyqtSignal()
 
-    def __init__(self, transcriber, model_name):
+class ExportTask(QRunnable):
+    """Tarea para exportar una transcripción en segundo plano"""
+    
+    def __init__(self, file_manager, transcription, export_path, formats):
+        super().__init__()
+        self.file_manager = file_manager
+        self.transcription = transcription
+        self.export_path = export_path
+        self.formats = formats
+        self.signals = ExportTaskSignals()
+    
+    def run(self):
+        """Ejecuta la exportación"""
+        try:
+            exported = self.file_manager.export_transcription_multi(
+                self.transcription,
+                self.export_path,
+                self.formats
+            )
+            self.signals.finished.emit(exported, self.export_path, list(self.formats))
+        except Exception as e:
+            logger.error(f"Error al exportar transcripción: {e}")
+            self.signals.error.emit(str(e))
+        finally:
+            self.signals.done.emit()
+
+class TaskExecutor:
+    """
+    Ejecuta tareas en un QThreadPool propio y reutilizable
+    
+    Con un solo hilo las tareas se completan en el orden en que se encolan.
+    """
+    
+    def __init__(self, max_threads=1, parent=None):
+        """
+        Args:
+            max_threads (int): Tareas simultáneas (Whisper ya usa varios hilos)
+            parent: QObject padre del pool
+        """
+        self.pool = QThreadPool(parent)
+        self.pool.setMaxThreadCount(max_threads)
+        self.tasks = set()  # Mantiene vivas las tareas en curso
+    
+    def submit(self, task):
+        """Encola una tarea y la devuelve"""
+        self.tasks.add(task)
+        task.signals.done.connect(lambda: self.tasks.discard(task))
+        self.pool.start(task)
+        return task
+    
+    def map(self, tasks):
+        """Encola varias tareas en orden"""
+        return [self.submit(task) for task in tasks]
+
+class ItemRecord(dict):
+    """
+    Diccionario asociado a un elemento de la lista de archivos
+    
+    PyQt convierte los dict simples en QVariantMap y QListWidgetItem.data()
+    devuelve copias; una subclase se guarda por referencia, de modo que los
+    cambios posteriores (p.ej. el hash de audio) son visibles desde el elemento.
+    """
+
+class LoadModelTaskSignals(QObject):
+    """Señales de una tarea de carga de modelo"""
+    finished = pyqtSignal(bool, str, str)  # éxito, nombre del modelo, mensaje de error
+    done = pyqtSignal()
+
+class LoadModelTask(QRunnable):
+    """Tarea para cargar un modelo Whisper en segundo plano"""
+    
+    def __init__(self, transcriber, model_name, quiet=False):
         super().__init__()
         self.transcriber = transcriber
         self.model_name = model_name
+        self.quiet = quiet
+        self.signals = LoadModelTaskSignals()
+    
+    def run(self):
+        """Carga el modelo"""
+        try:
+            success = self.transcriber.load_model(self.model_name, quiet=self.quiet)
+            self.signals.finished.emit(success, self.model_name, self.transcriber.load_error or "")
+        finally:
+            self.signals.done.emit()
+
+class ModelCheckTaskSignals(QObject):
+    """Señales de una comprobación de modelo descargado"""
+    finished = pyqtSignal(bool, str)  # descargado, nombre del modelo
+    done = pyqtSignal()
 
+class ModelCheckTask(QRunnable):
+    """Tarea para comprobar si un modelo ya está descargado sin crear el transcriptor"""
+    
+    def __init__(self, config_manager, model_name):
+        super().__init__()
+        self.config = config_manager
+        self.model_name = model_name
+        self.signals = ModelCheckTaskSignals()
+    
     def run(self):
-        # Conectar señales de progreso
-        self.transcriber.signals.progress.connect(self.progress.emit)
-        success = self.transcriber.load_model(self.model_name)
-        self.finished.emit(success, self.model_name)
+        """Comprueba la caché de modelos (importa whisper fuera del hilo de la interfaz)"""
+        try:
+            cached = is_model_cached(self.model_name, self.config)
+            self.signals.finished.emit(cached, self.model_name)
+        finally:
+            self.signals.done.emit()
 
-class ImportWorker(QThread):
+class ImportTaskSignals(QObject):
+    """Señales de una tarea de importación"""
     finished = pyqtSignal(dict, str, bool, str)  # file_info, file_path, is_recording, error
+    done = pyqtSignal()
+
+class ImportTask(QRunnable):
+    """Tarea para importar un archivo en segundo plano"""
+    
     def __init__(self, file_manager, file_path, normalize, is_recording):
         super().__init__()
         self.file_manager = file_manager
         self.file_path = file_path
         self.normalize = normalize
         self.is_recording = is_recording
-        self.error = None
-        self.file_info = None
+        self.signals = ImportTaskSignals()
+    
     def run(self):
+        """Importa el archivo"""
+        file_info, error = None, ""
         try:
-            self.file_info = self.file_manager.import_file(self.file_path, self.normalize)
+            file_info = self.file_manager.import_file(self.file_path, self.normalize)
         except Exception as e:
-            self.error = str(e)
-        self.finished.emit(self.file_info, self.file_path, self.is_recording, self.error)
+            error = str(e)
+        try:
+            self.signals.finished.emit(file_info or {}, self.file_path, self.is_recording, error)
+        finally:
+            self.signals.done.emit()
+
+class HashTaskSignals(QObject):
+    """Señales de una tarea de cálculo de hash"""
+    finished = pyqtSignal(str)  # audio_hash (vacío si hay error)
+    done = pyqtSignal()
 
-class ExportWorker(QThread):
-    finished = pyqtSignal(dict, str, list, str)  # exported, file_path, formats, error
-    def __init__(self, file_manager, transcription, file_path, formats):
+class HashTask(QRunnable):
+    """Tarea para calcular el hash de un audio en segundo plano"""
+    
+    def __init__(self, file_path):
         super().__init__()
-        self.file_manager = file_manager
-        self.transcription = transcription
         self.file_path = file_path
-        self.formats = formats
-        self.exported = None
-        self.error = None
+        self.signals = HashTaskSignals()
+    
     def run(self):
+        """Calcula el hash"""
         try:
-            self.exported = self.file_manager.export_transcription(self.transcription, self.file_path, self.formats)
-        except Exception as e:
-            self.error = str(e)
-        self.finished.emit(self.exported, self.file_path, self.formats, self.error)
+            audio_hash = compute_audio_hash(self.file_path)
+        except (IOError, OSError, ValueError) as e:
+            logger.warning(f"No se pudo calcular el hash del audio: {e}")
+            audio_hash = ""
+        try:
+            self.signals.finished.emit(audio_hash)
+        finally:
+            self.signals.done.emit()
 
 class MainWindow(QMainWindow):
     """Ventana principal de la aplicación"""
     
+    # Plantillas del panel de información (se formatean con str.format;
+    # los nombres y rutas se escapan antes de insertarlos)
+    RESULT_INFO_TEMPLATE = (
+        "<b>Archivo:</b> {file}<br>"
+        "<b>Idioma detectado:</b> {language}{translation}<br>"
+        "<b>Palabras:</b> {words}<br>"
+        "<b>Duración:</b> {duration}<br>"
+        "<b>Palabras clave:</b> {keywords}<br>"
+        "<b>Tiempo de proceso:</b> {time:.1f} segundos"
+    )
+    TRANSLATION_INFO_TEMPLATE = "<br><b>Traducción:</b> {source} → {target}"
+    FILE_INFO_TEMPLATE = (
+        "<b>Archivo:</b> {file}<br>"
+        "<b>Ruta:</b> {path}<br>"
+        "<b>Tamaño:</b> {size}<br>"
+        "<b>Duración:</b> {duration}<br>"
+        "<b>Estado:</b> No transcrito"
+    )
+    # Roles de datos de los elementos de la lista de archivos
+    FILE_INFO_ROLE = Qt.UserRole
+    RESULT_ROLE = Qt.UserRole + 1
+    # Caracteres insertados por iteración al mostrar transcripciones largas
+    TEXT_STREAM_CHUNK = 64 * 1024
+    # Retardo de la precarga del modelo tras mostrar la ventana
+    PREFETCH_DELAY_MS = 500
+    # Transcripciones cuyo documento maquetado se conserva
+    RENDERED_CACHE_SIZE = 3
+    # Retardo para agrupar cambios de selección consecutivos
+    SELECTION_DEBOUNCE_MS = 80
+    # Intervalo de refresco de los medidores de grabación (~30 Hz)
+    METER_INTERVAL_MS = 33
+    # Idiomas de los combos de origen y traducción (nombre, código)
+    LANGUAGES = (
+        ("Español", "es"),
+        ("Inglés", "en"),
+        ("Francés", "fr"),
+        ("Alemán", "de"),
+        ("Italiano", "it"),
+        ("Portugués", "pt"),
+        ("Chino", "zh"),
+        ("Japonés", "ja"),
+        ("Ruso", "ru"),
+        ("Coreano", "ko")
+    )
+    # Botones gestionados por set_button_states
+    STATE_BUTTONS = {
+        'txt': 'export_txt_btn',
+        'srt': 'export_srt_btn',
+        'vtt': 'export_vtt_btn',
+        'all': 'export_all_btn',
+        'edit': 'edit_btn',
+        'save_edit': 'save_edit_btn',
+        'cancel_edit': 'cancel_edit_btn',
+        'transcribe': 'transcribe_btn',
+        'import_': 'import_btn',
+        'record': 'record_btn',
+        'cancel': 'cancel_btn',
+    }
+    
     def __init__(self, config_manager):
         """
         Inicializa la ventana principal
@@ -117,17 +320,65 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.config = config_manager
         
-        # Inicializar componentes principales
-        self.transcriber = Transcriber(self.config)
-        self.recorder = AudioRecorder(self.config)
-        self.file_manager = FileManager(self.config)
+        # Inicializar componentes principales (transcriptor, grabador y gestor
+        # de archivos se crean al usarlos por primera vez)
+        self._transcriber = None
+        self._recorder = None
+        self._file_manager = None
+        self.transcription_cache = TranscriptionCache(self.config)
         
         # Estado de la aplicación
-        self.transcription_thread = None
+        self.transcription_executor = TaskExecutor(max_threads=1, parent=self)
+        self.transcription_task = None
+        self.hash_tasks = set()  # Tareas de hash en curso
+        # Las importaciones se procesan en orden en un único hilo reutilizado
+        self.import_executor = TaskExecutor(max_threads=1, parent=self)
+        self.export_tasks = set()  # Exportaciones manuales en curso
+        self.pending_imports = 0
+        self.imported_names = []  # Nombres importados pendientes de añadir a la lista
+        self.name_counters = {}  # {nombre base: último sufijo usado}
+        
+        # Inserción progresiva de transcripciones largas en el editor
+        self.pending_text = ""
+        self.pending_text_pos = 0
+        self.text_stream_timer = QTimer(self)
+        self.text_stream_timer.setInterval(0)
+        self.text_stream_timer.timeout.connect(self.stream_next_text_chunk)
+        # Documentos ya maquetados de las últimas transcripciones vistas
+        self.rendered_documents = OrderedDict()  # {nombre: (texto, QTextDocument)}
+        
+        # Estado del modo dictado (se crea al entrar por primera vez)
+        self.dictation_widget = None
+        self.realtime_transcriber = None
+        self.main_content_widget = None
+        self.is_dictating = False
+        self.dictation_last_text = ""
+        self.dictation_paused = False
+        self.dictation_error_box = None
+        
+        # Agrupación de cambios de selección en la lista de archivos
+        self.selection_timer = QTimer(self)
+        self.selection_timer.setSingleShot(True)
+        self.selection_timer.setInterval(self.SELECTION_DEBOUNCE_MS)
+        self.selection_timer.timeout.connect(self.apply_selection)
+        # Elemento cuyo documento se muestra; difiere de currentItem() mientras el retardo está pendiente
+        self.displayed_item = None
+        
+        # Medidores de grabación: se publican a ~30 Hz en lugar de en cada callback
+        self.last_level = 0.0
+        self.last_recording_time = 0
+        self.shown_level = -1
+        self.shown_recording_time = -1
+        self.meter_timer = QTimer(self)
+        self.meter_timer.setInterval(self.METER_INTERVAL_MS)
+        self.meter_timer.timeout.connect(self.flush_recording_meters)
         self.files = {}  # {name: file_info}
-        self.results = {}  # {name: transcription_result}
         self.current_file = None
-        self.original_text = ""  # Para edición
+        self.current_item = None
+        self.file_context_menu = None  # Se crea en el primer clic derecho
+        # Directorio temporal normalizado (solo se borran archivos dentro de él)
+        self._tempdir = os.path.realpath(tempfile.gettempdir())
+        self._last_ram_check = None  # (instante, GB disponibles)
         
         # Configurar UI
         self.setup_ui()
@@ -139,6 +390,9 @@ class MainWindow(QMainWindow):
         self.resize(1000, 700)
         self.statusBar().showMessage("Listo")
         
+        # Precargar el último modelo usado cuando la ventana ya esté visible
+        QTimer.singleShot(self.PREFETCH_DELAY_MS, self.prefetch_model)
+        
         logger.info("Ventana principal inicializada")
     
     def setup_ui(self):
@@ -172,32 +426,15 @@ class MainWindow(QMainWindow):
         lang_panel = QHBoxLayout()
         lang_panel.addWidget(QLabel("Idioma:"))
         self.language_combo = QComboBox()
-        self.language_combo.addItem("Detectar automáticamente", None)
         
         # Agregar idiomas soportados
-        languages = [
-            ("Español", "es"),
-            ("Inglés", "en"),
-            ("Francés", "fr"),
-            ("Alemán", "de"),
-            ("Italiano", "it"),
-            ("Portugués", "pt"),
-            ("Chino", "zh"),
-            ("Japonés", "ja"),
-            ("Ruso", "ru"),
-            ("Coreano", "ko")
-        ]
-        
-        for name, code in languages:
-            self.language_combo.addItem(name, code)
+        self.populate_language_combo(self.language_combo, "Detectar automáticamente", self.LANGUAGES)
         
         lang_panel.addWidget(self.language_combo)
         
         lang_panel.addWidget(QLabel("Traducir a:"))
         self.translate_combo = QComboBox()
-        self.translate_combo.addItem("No traducir", None)
-        for name, code in languages:
-            self.translate_combo.addItem(name, code)
+        self.populate_language_combo(self.translate_combo, "No traducir", self.LANGUAGES)
         
         lang_panel.addWidget(self.translate_combo)
         lang_panel.addStretch()
@@ -241,6 +478,7 @@ class MainWindow(QMainWindow):
         # Panel principal (dividido)
         splitter = QSplitter(Qt.Horizontal)
         main_layout.addWidget(splitter, 1)  # stretch = 1
+        self.main_content_widget = splitter
         
         # Panel izquierdo - Lista de archivos
         files_widget = QWidget()
@@ -272,6 +510,14 @@ class MainWindow(QMainWindow):
         text_layout.addWidget(QLabel("Transcripción:"))
         self.text_edit = QTextEdit()
         self.text_edit.setReadOnly(True)
+        # Documento de trabajo; las transcripciones vistas usan documentos propios
+        self.scratch_document = QTextDocument(self)
+        self.scratch_document.setDefaultFont(self.text_edit.font())
+        self.text_edit.setDocument(self.scratch_document)
+        # Paletas del área de texto (fondo amarillo claro en modo de edición)
+        self._normal_palette = self.text_edit.viewport().palette()
+        self._edit_palette = QPalette(self._normal_palette)
+        self._edit_palette.setColor(QPalette.Base, QColor("#FFFFD0"))
         text_layout.addWidget(self.text_edit)
         
         # Controles de edición
@@ -322,7 +568,7 @@ class MainWindow(QMainWindow):
         # Barra de estado
         self.statusBar()
         
-        self.setup_dictation_ui()
+        # La interfaz de dictado se construye al entrar por primera vez en ese modo
     
     def setup_menus(self):
         """Configura los menús de la aplicación"""
@@ -440,20 +686,6 @@ class MainWindow(QMainWindow):
         self.files_list.currentItemChanged.connect(self.file_selected)
         self.files_list.customContextMenuRequested.connect(self.show_file_context_menu)
         
-        # Señales del transcriptor
-        self.transcriber.signals.progress.connect(self.update_transcription_progress)
-        self.transcriber.signals.finished.connect(self.transcription_finished)
-        self.transcriber.signals.error.connect(self.transcription_error)
-        self.transcriber.signals.cancelled.connect(self.transcription_cancelled)
-        
-        # Señales del grabador
-        self.recorder.signals.recording_started.connect(self.recording_started)
-        self.recorder.signals.recording_stopped.connect(self.recording_stopped)
-        self.recorder.signals.recording_finished.connect(self.recording_finished)
-        self.recorder.signals.recording_error.connect(self.recording_error)
-        self.recorder.signals.recording_level.connect(self.update_recording_level)
-        self.recorder.signals.recording_time.connect(self.update_recording_time)
-        
         # Modelo y cierres
         self.model_combo.currentIndexChanged.connect(self.on_model_changed)
     
@@ -465,6 +697,113 @@ class MainWindow(QMainWindow):
         delete_shortcut = QShortcut(QKeySequence("Delete"), self)
         delete_shortcut.activated.connect(self.remove_selected_file)
     
+    @staticmethod
+    def populate_language_combo(combo, first_item, languages):
+        """
+        Rellena un combo de idiomas asignándole un modelo ya construido
+        
+        El modelo se llena antes de conectarlo al combo, de modo que no se
+        emiten señales ni se recalcula el combo por cada idioma.
+        
+        Args:
+            combo (QComboBox): Combo a rellenar
+            first_item (str): Texto de la primera opción (sin código de idioma)
+            languages (tuple): Pares (nombre, código)
+        """
+        model = QStandardItemModel(combo)
+        model.appendRow(QStandardItem(first_item))
+        for name, code in languages:
+            item = QStandardItem(name)
+            item.setData(code, Qt.UserRole)  # Leído con currentData()
+            model.appendRow(item)
+        combo.blockSignals(True)
+        try:
+            combo.setModel(model)
+        finally:
+            combo.blockSignals(False)
+    
+    def item_file_info(self, item):
+        """Devuelve la información de archivo asociada a un elemento de la lista"""
+        return item.data(self.FILE_INFO_ROLE) if item else None
+    
+    def item_result(self, item):
+        """Devuelve el resultado de transcripción asociado a un elemento de la lista"""
+        return item.data(self.RESULT_ROLE) if item else None
+    
+    @property
+    def transcriber(self):
+        """Transcriptor, creado y conectado en el primer acceso"""
+        if self._transcriber is None:
+            self._transcriber = Transcriber(self.config)
+            self._wire_transcriber_signals()
+        return self._transcriber
+    
+    def has_model(self):
+        """Indica si hay un modelo cargado sin crear el transcriptor"""
+        return self._transcriber is not None and self._transcriber.model is not None
+    
+    @property
+    def recorder(self):
+        """Grabador de audio, creado y conectado en el primer acceso"""
+        if self._recorder is None:
+            # sounddevice solo se importa cuando se necesita grabar
+            from whisper_app.core.recorder import AudioRecorder
+            self._recorder = AudioRecorder(self.config)
+            self._wire_recorder_signals()
+        return self._recorder
+    
+    @property
+    def file_manager(self):
+        """Gestor de archivos, creado en el primer acceso"""
+        if self._file_manager is None:
+            self._file_manager = FileManager(self.config)
+        return self._file_manager
+    
+    def is_recording(self):
+        """Indica si hay una grabación activa sin crear el grabador"""
+        return self._recorder is not None and self._recorder.is_active()
+    
+    def _wire_recorder_signals(self):
+        """Conecta las señales del grabador"""
+        signals = self._recorder.signals
+        signals.recording_started.connect(self.recording_started)
+        signals.recording_stopped.connect(self.recording_stopped)
+        signals.recording_finished.connect(self.recording_finished)
+        signals.recording_error.connect(self.recording_error)
+        signals.recording_level.connect(self.update_recording_level)
+        signals.recording_time.connect(self.update_recording_time)
+    
+    def _wire_transcriber_signals(self):
+        """Conecta las señales del transcriptor"""
+        self._transcriber.signals.progress.connect(self.update_transcription_progress)
+        self._transcriber.signals.error.connect(self.transcription_error)
+        self._transcriber.signals.cancelled.connect(self.transcription_cancelled)
+    
+    def set_button_states(self, **states):
+        """
+        Habilita o deshabilita varios botones de una vez
+        
+        Solo se llama a setEnabled en los botones cuyo estado cambia, evitando
+        eventos de cambio y repintados innecesarios.
+        
+        Args:
+            **states: Estado por botón (claves de STATE_BUTTONS)
+        """
+        for name, enabled in states.items():
+            button = getattr(self, self.STATE_BUTTONS[name])
+            if button.isEnabled() != enabled:
+                button.setEnabled(enabled)
+    
+    def set_transcription_controls(self, busy):
+        """
+        Ajusta los controles principales al iniciar o terminar una transcripción
+        
+        Args:
+            busy (bool): True mientras hay una transcripción en curso
+        """
+        self.set_button_states(transcribe=not busy, import_=not busy, record=not busy, cancel=busy)
+    
+    @pyqtSlot(int)
     def on_model_changed(self, index):
         """Gestiona cambios en la selección del modelo"""
         model_name = self.model_combo.currentText()
@@ -488,6 +827,7 @@ class MainWindow(QMainWindow):
         # Actualizar configuración
         self.config.set("model_size", model_name)
     
+    @pyqtSlot()
     def import_files(self):
         """Importa archivos de audio/video"""
         file_filter = self.file_manager.get_supported_file_filter()
@@ -505,9 +845,8 @@ class MainWindow(QMainWindow):
         last_dir = os.path.dirname(files[0])
         self.config.set("last_import_dir", last_dir)
         
-        # Importar cada archivo
-        for file_path in files:
-            self.import_file(file_path)
+        # Importar todos los archivos en un único lote
+        self.start_imports(files)
     
     def import_file(self, file_path, is_recording=False):
         """
@@ -517,6 +856,18 @@ class MainWindow(QMainWindow):
             file_path (str): Ruta al archivo
             is_recording (bool): Si es un archivo de grabación
         """
+        self.start_imports([file_path], is_recording)
+    
+    def start_imports(self, file_paths, is_recording=False):
+        """
+        Lanza la importación de varios archivos en segundo plano
+        
+        Los elementos se añaden a la lista cuando termina todo el lote.
+        
+        Args:
+            file_paths (list): Rutas de los archivos
+            is_recording (bool): Si son archivos de grabación
+        """
         if not verify_ffmpeg_components():
             instructions = get_ffmpeg_install_instructions()
             QMessageBox.critical(
@@ -527,50 +878,144 @@ class MainWindow(QMainWindow):
             return
         normalize = self.config.get("normalize_audio", False)
         self.import_btn.setEnabled(False)
-        self.status_label.setText(f"Importando '{os.path.basename(file_path)}'...")
+        if len(file_paths) == 1:
+            self.status_label.setText(f"Importando '{os.path.basename(file_paths[0])}'...")
+        else:
+            self.status_label.setText(f"Importando {len(file_paths)} archivos...")
         self.progress_bar.setRange(0, 0)
-        self.import_worker = ImportWorker(self.file_manager, file_path, normalize, is_recording)
-        self.import_worker.finished.connect(self.on_import_finished)
-        self.import_worker.start()
+        self.pending_imports += len(file_paths)
+        tasks = [
+            ImportTask(self.file_manager, file_path, normalize, is_recording)
+            for file_path in file_paths
+        ]
+        for task in tasks:
+            task.signals.finished.connect(self.on_import_finished)
+        self.import_executor.map(tasks)
 
     def on_import_finished(self, file_info, file_path, is_recording, error):
-        self.import_btn.setEnabled(True)
-        self.progress_bar.setRange(0, 100)
-        self.status_label.setText("Listo")
+        self.pending_imports -= 1
         if error:
             logger.error(f"Error importando archivo: {error}")
             QMessageBox.critical(self, "Error", f"Error al importar archivo: {error}")
-            return
-        if not file_info:
+        elif not file_info:
             QMessageBox.warning(self, "Error al importar", f"No se pudo importar el archivo: {file_path}")
-            return
+        else:
+            self.imported_names.append(self.register_imported_file(file_info, is_recording))
+        if self.pending_imports <= 0:
+            self.pending_imports = 0
+            self.finish_imports()
+    
+    def register_imported_file(self, file_info, is_recording=False):
+        """
+        Registra un archivo importado con un nombre único
+        
+        Args:
+            file_info (dict): Información del archivo
+            is_recording (bool): Si es un archivo de grabación
+        
+        Returns:
+            str: Nombre asignado
+        """
+        file_info = ItemRecord(file_info)
         name = file_info['name']
         if is_recording:
             timestamp = file_info['created'].strftime("%Y%m%d_%H%M%S")
             name = f"Grabación_{timestamp}.wav"
             file_info['name'] = name
-        base_name = name
-        counter = 1
-        while name in self.files:
-            root, ext = os.path.splitext(base_name)
-            name = f"{root}_{counter}{ext}"
-            counter += 1
+        if name in self.files:
+            # El contador por nombre base evita recorrer todos los sufijos ya usados
+            root, ext = os.path.splitext(name)
+            counter = self.name_counters.get(name, 0)
+            while name in self.files:
+                counter += 1
+                name = f"{root}_{counter}{ext}"
+            self.name_counters[file_info['name']] = counter
             file_info['name'] = name
         self.files[name] = file_info
-        item = QListWidgetItem(name)
-        self.files_list.addItem(item)
-        self.files_list.setCurrentItem(item)
-        if self.transcriber.model:
-            self.transcribe_btn.setEnabled(True)
+        if self.transcription_cache.enabled:
+            self.start_audio_hash(file_info)
         logger.info(f"Archivo importado: {name}")
-        self.statusBar().showMessage(f"Archivo importado: {name}", 3000)
+        return name
+    
+    def finish_imports(self):
+        """Añade a la lista todos los archivos del lote con un único repintado"""
+        self.import_btn.setEnabled(True)
+        self.progress_bar.setRange(0, 100)
+        self.status_label.setText("Listo")
+        names, self.imported_names = self.imported_names, []
+        if not names:
+            return
+        
+        self.files_list.setUpdatesEnabled(False)
+        self.files_list.blockSignals(True)
+        try:
+            first_row = self.files_list.count()
+            self.files_list.addItems(names)
+            # Asociar la información de cada archivo a su elemento
+            for row, name in enumerate(names, start=first_row):
+                self.files_list.item(row).setData(self.FILE_INFO_ROLE, self.files[name])
+        finally:
+            self.files_list.blockSignals(False)
+            self.files_list.setUpdatesEnabled(True)
+        # Seleccionar solo el último: un único currentItemChanged
+        self.files_list.setCurrentRow(self.files_list.count() - 1)
+        
+        if self.has_model():
+            self.transcribe_btn.setEnabled(True)
+        if len(names) == 1:
+            self.statusBar().showMessage(f"Archivo importado: {names[0]}", 3000)
+        else:
+            self.statusBar().showMessage(f"{len(names)} archivos importados", 3000)
+    
+    def start_audio_hash(self, file_info):
+        """
+        Calcula en segundo plano el hash del audio usado como clave de caché
+        
+        Args:
+            file_info (ItemRecord): Registro del archivo; el hash se guarda en
+                este mismo objeto, no en el que tenga su nombre al terminar
+        """
+        task = HashTask(file_info['processed_path'])
+        task.signals.finished.connect(
+            lambda audio_hash, record=file_info: self.on_hash_finished(record, audio_hash)
+        )
+        self.hash_tasks.add(task)
+        task.signals.done.connect(lambda: self.hash_tasks.discard(task))
+        QThreadPool.globalInstance().start(task)
+
+    def on_hash_finished(self, file_info, audio_hash):
+        """Guarda el hash en el registro para el que se calculó"""
+        if audio_hash:
+            file_info['audio_hash'] = audio_hash
+    
+    def available_ram_gb(self, ttl=5.0):
+        """
+        Devuelve la RAM disponible en GB, reutilizando la última medición
+        
+        Args:
+            ttl (float): Segundos durante los que se reutiliza la medición
+            
+        Returns:
+            float: Memoria disponible en GB
+        """
+        now = time.monotonic()
+        if self._last_ram_check is None or now - self._last_ram_check[0] > ttl:
+            self._last_ram_check = (now, psutil.virtual_memory().available / (1024**3))
+        return self._last_ram_check[1]
     
+    @pyqtSlot()
     def load_model(self):
         """Carga el modelo seleccionado en un hilo y muestra el diálogo de descarga real"""
         model_name = self.model_combo.currentText()
+        # El modelo ya está en memoria: no crear tarea ni diálogo
+        if self.has_model() and self._transcriber.current_model_name == model_name:
+            self.status_label.setText(f"Modelo '{model_name}' ya cargado")
+            if self.files_list.count() > 0 and self.transcription_task is None:
+                self.transcribe_btn.setEnabled(True)
+            return
         # Chequeo de memoria antes de modelos grandes
         if model_name in ["medium", "large"] and psutil is not None:
-            ram_gb = psutil.virtual_memory().available / (1024**3)
+            ram_gb = self.available_ram_gb()
             min_ram = 3 if model_name == "medium" else 6
             if ram_gb < min_ram:
                 logger.warning(f"RAM disponible insuficiente para el modelo '{model_name}': {ram_gb:.1f} GB (recomendado: {min_ram} GB)")
@@ -583,40 +1028,99 @@ class MainWindow(QMainWindow):
         self.progress_bar.setValue(10)
         self.load_model_btn.setEnabled(False)
         self.transcribe_btn.setEnabled(False)
-        QApplication.processEvents()
 
-        # Crear diálogo de descarga
-        dialog = ModelDownloadDialog(model_name, self)
-        dialog.progress_bar.setValue(10)
-        dialog.status_label.setText("Preparando descarga...")
+        # Crear diálogo de descarga en el mismo directorio en que Whisper busca el modelo
+        dialog = ModelDownloadDialog(
+            model_name, self, download_root=model_download_root(self.config)
+        )
 
-        # Crear hilo de carga
-        self.model_loader_thread = ModelLoaderThread(self.transcriber, model_name)
-        self.model_loader_thread.progress.connect(lambda v, m: (dialog.progress_bar.setValue(v), dialog.status_label.setText(m)))
-        
-        def on_finish(success, model_name):
-            dialog.accept()  # Cierra el diálogo
-            self.load_model_btn.setEnabled(True)
-            if success:
-                self.status_label.setText(f"Modelo '{model_name}' cargado correctamente")
-                if self.files_list.count() > 0:
-                    self.transcribe_btn.setEnabled(True)
-                self.progress_bar.setValue(100)
-                self.statusBar().showMessage(f"Modelo {model_name} cargado", 3000)
-            else:
-                self.status_label.setText("Error al cargar modelo")
-                self.progress_bar.setValue(0)
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    f"No se pudo cargar el modelo '{model_name}'.\n\nVerifica tu conexión a internet y el espacio disponible."
-                )
-            self.model_loader_thread = None
+        # Crear tarea de carga; se ejecuta en el pool de transcripción para no
+        # solaparse con una transcripción en curso
+        task = LoadModelTask(self.transcriber, model_name)
+        # Conexiones directas al diálogo: Qt las elimina si el diálogo se destruye al cerrarse
+        self.transcriber.signals.progress.connect(dialog.download_progress)
+        task.signals.finished.connect(dialog.accept, Qt.QueuedConnection)
+        task.signals.finished.connect(self.on_model_loaded)
 
-        self.model_loader_thread.finished.connect(on_finish)
-        self.model_loader_thread.start()
-        dialog.exec_()
+        # Descargar primero con progreso real (termina al instante si el modelo
+        # ya está en caché) y cargarlo cuando el archivo esté disponible
+        load_started = []
+        def start_load(path):
+            load_started.append(path)
+            self.transcription_executor.submit(task)
+        dialog.download_complete.connect(start_load)
+        dialog.start_download()
+
+        if dialog.exec_() == QDialog.Rejected and not load_started:
+            # Descarga cancelada o fallida: la carga no llegó a empezar
+            self.load_model_btn.setEnabled(True)
+            self.progress_bar.setValue(0)
+            self.status_label.setText(f"Descarga del modelo '{model_name}' interrumpida")
+            if self.has_model() and self.files_list.count() > 0 and self.transcription_task is None:
+                self.transcribe_btn.setEnabled(True)
+    
+    @pyqtSlot()
+    def prefetch_model(self):
+        """Carga en segundo plano el último modelo usado si ya está descargado"""
+        if not self.config.get("prefetch_model", True) or self.has_model():
+            return
+        model_name = self.config.get("model_size", "base")
+        # Comprobar la caché en segundo plano; el transcriptor solo se crea
+        # si de verdad hay un modelo que precargar
+        task = ModelCheckTask(self.config, model_name)
+        task.signals.finished.connect(self.on_model_checked)
+        self.transcription_executor.submit(task)
+    
+    @pyqtSlot(bool, str)
+    def on_model_checked(self, cached, model_name):
+        """Inicia la precarga si el modelo ya está descargado"""
+        # No iniciar descargas sin que el usuario lo pida
+        if not cached:
+            logger.debug(f"Modelo '{model_name}' no descargado, se omite la precarga")
+            return
+        # El usuario ya cargó (o está cargando) un modelo
+        if self._transcriber is not None:
+            return
+        
+        logger.info(f"Precargando modelo '{model_name}' en segundo plano")
+        # Sin progreso: la precarga solo informa en la barra de estado
+        task = LoadModelTask(self.transcriber, model_name, quiet=True)
+        task.signals.finished.connect(self.on_model_prefetched)
+        # Si el usuario carga otro modelo, su tarea se encola detrás de esta
+        self.transcription_executor.submit(task)
+    
+    @pyqtSlot(bool, str, str)
+    def on_model_prefetched(self, success, model_name, error_msg):
+        """Informa en la barra de estado del resultado de la precarga"""
+        if not success:
+            logger.warning(f"Precarga fallida: {error_msg}")
+            self.statusBar().showMessage(f"No se pudo precargar el modelo {model_name}", 3000)
+            return
+        if self.files_list.count() > 0 and self.transcription_task is None:
+            self.transcribe_btn.setEnabled(True)
+        self.statusBar().showMessage(f"Modelo {model_name} precargado", 3000)
+    
+    @pyqtSlot(bool, str, str)
+    def on_model_loaded(self, success, model_name, error_msg):
+        """Restaura la interfaz tras cargar un modelo"""
+        self.load_model_btn.setEnabled(True)
+        if success:
+            self.status_label.setText(f"Modelo '{model_name}' cargado correctamente")
+            if self.files_list.count() > 0:
+                self.transcribe_btn.setEnabled(True)
+            self.progress_bar.setValue(100)
+            self.statusBar().showMessage(f"Modelo {model_name} cargado", 3000)
+        else:
+            self.status_label.setText("Error al cargar modelo")
+            self.progress_bar.setValue(0)
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"No se pudo cargar el modelo '{model_name}'.\n\n{error_msg}\n\n"
+                "Verifica tu conexión a internet y el espacio disponible."
+            )
     
+    @pyqtSlot()
     def toggle_recording(self):
         """Inicia o detiene la grabación de audio"""
         if not self.recorder.is_active():
@@ -634,12 +1138,18 @@ class MainWindow(QMainWindow):
             self.recorder.stop_recording()
             # La señal de finalización gestionará el resultado
     
+    @pyqtSlot()
     def recording_started(self):
         """Gestiona el inicio de grabación"""
         self.record_btn.setText("Detener Grabación")
         self.status_label.setText("Grabando audio desde micrófono...")
         self.time_label.setText("00:00")
         self.progress_bar.setValue(0)
+        self.last_level = 0.0
+        self.last_recording_time = 0
+        self.shown_level = 0
+        self.shown_recording_time = 0
+        self.meter_timer.start()
         
         # Deshabilitar botones incompatibles
         self.import_btn.setEnabled(False)
@@ -647,10 +1157,13 @@ class MainWindow(QMainWindow):
         
         self.statusBar().showMessage("Grabación en curso", 3000)
     
+    @pyqtSlot()
     def recording_stopped(self):
         """Gestiona la parada de grabación"""
+        self.meter_timer.stop()
         self.status_label.setText("Finalizando grabación...")
     
+    @pyqtSlot(str)
     def recording_finished(self, file_path):
         """Gestiona la finalización de grabación"""
         self.record_btn.setText("Grabar Micrófono")
@@ -665,8 +1178,10 @@ class MainWindow(QMainWindow):
         
         self.statusBar().showMessage("Grabación finalizada", 3000)
     
+    @pyqtSlot(str)
     def recording_error(self, error_msg):
         """Gestiona errores de grabación"""
+        self.meter_timer.stop()
         self.record_btn.setText("Grabar Micrófono")
         self.status_label.setText("Error de grabación")
         self.progress_bar.setValue(0)
@@ -682,29 +1197,41 @@ class MainWindow(QMainWindow):
         
         self.statusBar().showMessage("Error de grabación", 3000)
     
+    @pyqtSlot(float)
     def update_recording_level(self, level):
-        """Actualiza nivel de audio durante grabación"""
-        if self.recorder.is_active():
-            level_percent = min(int(level * 100), 100)
-            self.progress_bar.setValue(level_percent)
+        """Registra el nivel de audio; se muestra en flush_recording_meters"""
+        self.last_level = level
     
+    @pyqtSlot(int)
     def update_recording_time(self, seconds):
-        """Actualiza tiempo de grabación"""
-        minutes = seconds // 60
-        secs = seconds % 60
-        self.time_label.setText(f"{minutes:02}:{secs:02}")
+        """Registra el tiempo de grabación; se muestra en flush_recording_meters"""
+        self.last_recording_time = seconds
     
+    @pyqtSlot()
+    def flush_recording_meters(self):
+        """Publica el último nivel y tiempo de grabación si han cambiado"""
+        if not self.is_recording():
+            return
+        level_percent = min(int(self.last_level * 100), 100)
+        if level_percent != self.shown_level:
+            self.shown_level = level_percent
+            self.progress_bar.setValue(level_percent)
+        if self.last_recording_time != self.shown_recording_time:
+            self.shown_recording_time = self.last_recording_time
+            minutes, secs = divmod(self.last_recording_time, 60)
+            self.time_label.setText(f"{minutes:02}:{secs:02}")
+    
+    @pyqtSlot()
     def transcribe(self):
         """Inicia el proceso de transcripción"""
         # Chequeo de memoria antes de archivos largos
         current_item = self.files_list.currentItem()
         if current_item:
-            file_name = current_item.text()
-            if file_name in self.files:
-                file_info = self.files[file_name]
+            file_info = self.item_file_info(current_item)
+            if file_info is not None:
                 duration = file_info.get('duration', 0)
                 if duration > 3600 and psutil is not None:  # Más de 1 hora
-                    ram_gb = psutil.virtual_memory().available / (1024**3)
+                    ram_gb = self.available_ram_gb()
                     if ram_gb < 4:
                         logger.warning(f"RAM disponible baja para transcripción larga: {ram_gb:.1f} GB")
                         QMessageBox.warning(
@@ -712,13 +1239,12 @@ class MainWindow(QMainWindow):
                             "Advertencia de memoria",
                             f"La memoria RAM disponible es baja ({ram_gb:.1f} GB).\n\nTranscribir archivos muy largos puede requerir al menos 4 GB de RAM libre.\n\nLa aplicación podría fallar o volverse inestable."
                         )
-        if not self.transcriber.model:
+        if not self.has_model():
             # Intentar cargar modelo automáticamente
             self.load_model()
-            if not self.transcriber.model:
+            if not self.has_model():
                 return
         
-        current_item = self.files_list.currentItem()
         if not current_item:
             QMessageBox.warning(
                 self,
@@ -727,8 +1253,8 @@ class MainWindow(QMainWindow):
             )
             return
         
-        file_name = current_item.text()
-        if file_name not in self.files:
+        file_info = self.item_file_info(current_item)
+        if file_info is None:
             QMessageBox.warning(
                 self,
                 "Archivo no encontrado",
@@ -736,35 +1262,50 @@ class MainWindow(QMainWindow):
             )
             return
         
-        file_info = self.files[file_name]
+        file_name = current_item.text()
         self.current_file = file_name
+        self.current_item = current_item
         
         # Obtener idioma seleccionado
         language = self.language_combo.currentData()
         translate_to = self.translate_combo.currentData()
         
+        # Reutilizar una transcripción previa del mismo audio/modelo/idioma
+        # (el hash se calcula en segundo plano al importar; si aún no está listo, no se usa la caché)
+        cache_key = None
+        audio_hash = file_info.get('audio_hash')
+        if self.transcription_cache.enabled and audio_hash:
+            cache_key = TranscriptionCache.make_key(
+                audio_hash, self.transcriber.current_model_name, language, translate_to
+            )
+            cached = self.transcription_cache.get(cache_key)
+            if cached is not None:
+                self.status_label.setText(f"Transcripción de '{file_name}' recuperada de la caché")
+                QTimer.singleShot(0, lambda: self.transcription_finished(cached))
+                return
+        
         # Actualizar estado
         self.status_label.setText(f"Transcribiendo '{file_name}'...")
         self.progress_bar.setValue(0)
         
         # Deshabilitar controles durante transcripción
-        self.transcribe_btn.setEnabled(False)
-        self.import_btn.setEnabled(False)
-        self.record_btn.setEnabled(False)
-        self.cancel_btn.setEnabled(True)
+        self.set_transcription_controls(True)
         
         # Limpiar área de texto
-        self.text_edit.clear()
+        self.clear_transcription_text()
         self.info_label.setText("Procesando...")
         
         # Iniciar transcripción en hilo secundario
-        self.transcription_thread = TranscriptionThread(
+        self.transcription_task = TranscriptionTask(
             self.transcriber,
             file_info,
             language,
-            translate_to
+            translate_to,
+            self.transcription_cache,
+            cache_key
         )
-        self.transcription_thread.start()
+        self.transcription_task.signals.finished.connect(self.transcription_finished)
+        self.transcription_executor.submit(self.transcription_task)
         
         self.statusBar().showMessage(f"Transcribiendo {file_name}...")
     
@@ -774,51 +1315,243 @@ class MainWindow(QMainWindow):
         self.progress_bar.setValue(value)
         self.status_label.setText(message)
     
+    def set_transcription_text(self, text, document=None):
+        """
+        Muestra una transcripción en el editor
+        
+        Los textos largos se insertan por bloques de TEXT_STREAM_CHUNK
+        caracteres desde el bucle de eventos para no bloquear la interfaz.
+        
+        Args:
+            text (str): Texto de la transcripción
+            document (QTextDocument, optional): Documento destino.
+                Si es None, se usa el documento de trabajo.
+        """
+        self.stop_text_stream()
+        self._show_document(document or self.scratch_document)
+        if len(text) <= self.TEXT_STREAM_CHUNK:
+            self.text_edit.setPlainText(text)
+            return
+        
+        self.text_edit.clear()
+        self.pending_text = text
+        self.pending_text_pos = 0
+        self.text_edit.setUpdatesEnabled(False)
+        self.text_stream_timer.start()
+    
+    def show_result_text(self, file_name, text):
+        """
+        Muestra la transcripción de un archivo reutilizando su documento si existe
+        
+        Se conservan los documentos de las últimas RENDERED_CACHE_SIZE
+        transcripciones vistas, de modo que volver a ellas no repite la
+        inserción ni la maquetación del texto.
+        
+        Args:
+            file_name (str): Nombre del archivo
+            text (str): Texto de la transcripción
+        """
+        cached = self.rendered_documents.get(file_name)
+        if cached is not None and cached[0] is text:
+            self.rendered_documents.move_to_end(file_name)
+            if cached[1] is self.text_edit.document():
+                # Ya visible (o insertándose): no tocar el editor
+                return
+            self.stop_text_stream()
+            self._show_document(cached[1])
+            return
+        
+        self.forget_rendered_text(file_name)
+        document = QTextDocument(self)
+        document.setDefaultFont(self.text_edit.font())
+        self.rendered_documents[file_name] = (text, document)
+        while len(self.rendered_documents) > self.RENDERED_CACHE_SIZE:
+            _, (_, old_document) = self.rendered_documents.popitem(last=False)
+            self._release_document(old_document)
+        self.set_transcription_text(text, document)
+    
+    def forget_rendered_text(self, file_name):
+        """Descarta el documento conservado de un archivo"""
+        cached = self.rendered_documents.pop(file_name, None)
+        if cached is not None:
+            self._release_document(cached[1])
+    
+    def _show_document(self, document):
+        previous = self.text_edit.document()
+        if previous is document:
+            return
+        self.text_edit.setDocument(document)
+        self._release_document(previous)
+    
+    def _release_document(self, document):
+        # Se elimina solo si no está visible, no es el de trabajo y ya no está en caché
+        if document is self.scratch_document or document is self.text_edit.document():
+            return
+        if any(cached_doc is document for _, cached_doc in self.rendered_documents.values()):
+            return
+        document.deleteLater()
+    
+    def clear_transcription_text(self):
+        """Limpia el editor cancelando cualquier inserción pendiente"""
+        self.stop_text_stream()
+        self._show_document(self.scratch_document)
+        self.text_edit.clear()
+    
+    @pyqtSlot()
+    def stream_next_text_chunk(self):
+        """Inserta el siguiente bloque de la transcripción pendiente"""
+        end = self.pending_text_pos + self.TEXT_STREAM_CHUNK
+        self._insert_pending_text(end)
+        if self.pending_text_pos >= len(self.pending_text):
+            self.stop_text_stream()
+    
+    def flush_text_stream(self):
+        """Inserta de inmediato el texto pendiente"""
+        if self.text_stream_timer.isActive():
+            self._insert_pending_text(len(self.pending_text))
+            self.stop_text_stream()
+    
+    def stop_text_stream(self):
+        """Detiene la inserción progresiva y reactiva el repintado"""
+        if not self.text_stream_timer.isActive():
+            return
+        self.text_stream_timer.stop()
+        if self.pending_text_pos < len(self.pending_text):
+            # Documento incompleto: no debe reutilizarse
+            for file_name, (_, document) in list(self.rendered_documents.items()):
+                if document is self.text_edit.document():
+                    del self.rendered_documents[file_name]
+        self.pending_text = ""
+        self.pending_text_pos = 0
+        self.text_edit.setUpdatesEnabled(True)
+    
+    def _insert_pending_text(self, end):
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(self.pending_text[self.pending_text_pos:end])
+        self.pending_text_pos = end
+    
+    def _compute_info_html(self, file_name, file_info):
+        """
+        Devuelve la información HTML de un archivo sin transcribir
+        
+        El resultado se guarda en file_info junto con una huella de los datos
+        mostrados y solo se recalcula si estos cambian.
+        
+        Args:
+            file_name (str): Nombre mostrado del archivo
+            file_info (dict): Información del archivo
+        
+        Returns:
+            str: HTML para el panel de información
+        """
+        fingerprint = (
+            file_name,
+            file_info.get('size', 0),
+            file_info.get('duration', 0),
+            file_info.get('original_path', '')
+        )
+        if file_info.get('_info_fingerprint') == fingerprint:
+            return file_info['_info_html']
+        
+        # Formatear duración
+        duration = file_info.get('duration', 0)
+        duration_str = self.format_duration(duration) if duration else "Desconocida"
+        
+        file_info['_info_html'] = self.FILE_INFO_TEMPLATE.format(
+            file=html.escape(file_name),
+            path=html.escape(file_info.get('original_path', '')),
+            size=format_file_size(file_info.get('size', 0)),
+            duration=duration_str
+        )
+        file_info['_info_fingerprint'] = fingerprint
+        return file_info['_info_html']
+    
+    def _compute_result_info_html(self, file_name, result):
+        """
+        Devuelve la información HTML de un archivo transcrito
+        
+        Args:
+            file_name (str): Nombre mostrado del archivo
+            result (dict): Resultado de la transcripción
+        
+        Returns:
+            str: HTML para el panel de información
+        """
+        if '_info_html' in result:
+            return result['_info_html']
+        
+        transcription = result["result"]
+        if "_word_count" not in transcription:
+            self.update_text_stats(transcription)
+        if "keywords" not in result:
+            # Resultados recuperados de versiones anteriores de la caché
+            result["keywords"] = transcription_keywords(transcription)
+        result['_info_html'] = self.RESULT_INFO_TEMPLATE.format(
+            file=html.escape(file_name),
+            language=transcription.get("language", "desconocido"),
+            translation=self.format_translation_info(result),
+            words=transcription["_word_count"],
+            duration=transcription["_duration_str"],
+            keywords=", ".join(result["keywords"]),
+            time=result.get('time', 0)
+        )
+        return result['_info_html']
+    
+    @staticmethod
+    def format_duration(seconds):
+        """
+        Formatea una duración como m:ss
+        
+        Args:
+            seconds (float): Duración en segundos
+        
+        Returns:
+            str: Duración formateada
+        """
+        minutes, secs = divmod(int(seconds), 60)
+        return f"{minutes}:{secs:02}"
+    
+    def format_translation_info(self, result):
+        """Devuelve la línea HTML de traducción de un resultado o una cadena vacía"""
+        if not result.get("translated", False):
+            return ""
+        return self.TRANSLATION_INFO_TEMPLATE.format(
+            source=result.get("language_source", "desconocido"),
+            target=result.get("language_target", "desconocido")
+        )
+    
+    def update_text_stats(self, transcription):
+        """
+        Calcula y guarda en la transcripción sus palabras y duración
+        
+        Se hace una sola vez al terminar la transcripción (o al editarla) para
+        no recorrer el texto completo cada vez que se selecciona el archivo.
+        
+        Args:
+            transcription (dict): Resultado de Whisper
+        """
+        transcription["_word_count"] = count_words(transcription["text"])
+        transcription["_duration_str"] = self.format_duration(transcription.get("duration", 0))
+    
     @pyqtSlot(dict)
     def transcription_finished(self, result):
         """Gestiona finalización de transcripción"""
         if not self.current_file:
             return
         
-        # Guardar resultado
-        self.results[self.current_file] = result
+        # Guardar resultado en el elemento de la lista
+        result = ItemRecord(result)
+        if self.current_item is not None:
+            self.current_item.setData(self.RESULT_ROLE, result)
         
         # Mostrar resultado
         transcription = result["result"]
-        self.text_edit.setPlainText(transcription["text"])
-        
-        # Mostrar información
-        file_info = self.files[self.current_file]
-        language = transcription.get("language", "desconocido")
-        words = len(transcription["text"].split())
-        duration = transcription.get("duration", 0)
-        duration_str = f"{int(duration // 60)}:{int(duration % 60):02}"
-        
-        # Extraer palabras clave usando el idioma detectado
-        lang_code = language if language and language != "desconocido" else "es"
-        # Validar si el idioma está soportado por get_stopwords
-        if not get_stopwords(lang_code):
-            logger.warning(f"Idioma '{lang_code}' no soportado para palabras clave, usando 'es' como fallback.")
-            lang_code = "es"
-        keywords = extract_keywords(transcription["text"], language=lang_code)
-        keywords_str = ", ".join(keywords)
-        
-        # Información de traducción si aplica
-        translation_info = ""
-        if result.get("translated", False):
-            source_lang = result.get("language_source", "desconocido")
-            target_lang = result.get("language_target", "desconocido")
-            translation_info = f"<br><b>Traducción:</b> {source_lang} → {target_lang}"
-        
-        # Mostrar info
-        self.info_label.setText(
-            f"<b>Archivo:</b> {self.current_file}<br>"
-            f"<b>Idioma detectado:</b> {language}{translation_info}<br>"
-            f"<b>Palabras:</b> {words}<br>"
-            f"<b>Duración:</b> {duration_str}<br>"
-            f"<b>Palabras clave:</b> {keywords_str}<br>"
-            f"<b>Tiempo de proceso:</b> {result['time']:.1f} segundos"
-        )
+        self.show_result_text(self.current_file, transcription["text"])
+        
+        # Mostrar info (se guarda para no recalcularla al cambiar de archivo)
+        self.update_text_stats(transcription)
+        self.info_label.setText(self._compute_result_info_html(self.current_file, result))
         
         # Exportación automática si está configurada
         if self.config.get("auto_export", False):
@@ -828,42 +1561,40 @@ class MainWindow(QMainWindow):
                 base_name = os.path.splitext(self.current_file)[0]
                 export_path = os.path.join(export_dir, base_name)
                 
-                # Exportar en formatos configurados
+                # Exportar en formatos configurados sin bloquear la interfaz
                 formats = self.config.get("export_formats", ["txt", "srt", "vtt"])
-                try:
-                    self.file_manager.export_transcription(
-                        transcription,
-                        export_path,
-                        formats
-                    )
-                    self.statusBar().showMessage(
-                        f"Exportación automática completada en {export_dir}", 
-                        5000
-                    )
-                except Exception as e:
-                    logger.error(f"Error en exportación automática: {e}")
+                task = ExportTask(self.file_manager, transcription, export_path, formats)
+                task.signals.finished.connect(self.on_auto_export_finished)
+                task.signals.error.connect(self.on_auto_export_error)
+                self.transcription_executor.submit(task)
         
         # Actualizar controles
         self.progress_bar.setValue(100)
         self.status_label.setText("Transcripción completada")
         
-        self.transcribe_btn.setEnabled(True)
-        self.import_btn.setEnabled(True)
-        self.record_btn.setEnabled(True)
-        self.cancel_btn.setEnabled(False)
+        self.set_transcription_controls(False)
         
         # Habilitar botones de exportación y edición
-        self.export_txt_btn.setEnabled(True)
-        self.export_srt_btn.setEnabled(True)
-        self.export_vtt_btn.setEnabled(True)
-        self.export_all_btn.setEnabled(True)
-        self.edit_btn.setEnabled(True)
+        self.set_button_states(txt=True, srt=True, vtt=True, all=True, edit=True)
         
-        # Limpiar referencia al hilo
-        self.transcription_thread = None
+        # Limpiar referencia a la tarea
+        self.transcription_task = None
         
         self.statusBar().showMessage("Transcripción completada", 3000)
     
+    @pyqtSlot(dict, str, list)
+    def on_auto_export_finished(self, exported, export_path, formats):
+        """Muestra el resultado de la exportación automática"""
+        self.statusBar().showMessage(
+            f"Exportación automática completada en {os.path.dirname(export_path)}",
+            5000
+        )
+    
+    @pyqtSlot(str)
+    def on_auto_export_error(self, error_msg):
+        """Informa de un error en la exportación automática"""
+        self.statusBar().showMessage(f"Error en exportación automática: {error_msg}", 5000)
+    
     @pyqtSlot(str)
     def transcription_error(self, error_msg):
         """Gestiona errores de transcripción"""
@@ -871,10 +1602,7 @@ class MainWindow(QMainWindow):
         self.status_label.setText("Error durante la transcripción")
         
         # Restaurar controles
-        self.transcribe_btn.setEnabled(True)
-        self.import_btn.setEnabled(True)
-        self.record_btn.setEnabled(True)
-        self.cancel_btn.setEnabled(False)
+        self.set_transcription_controls(False)
         
         # Mostrar error
         QMessageBox.critical(
@@ -883,30 +1611,29 @@ class MainWindow(QMainWindow):
             f"Error durante la transcripción:\n\n{error_msg}"
         )
         
-        # Limpiar referencia al hilo
-        self.transcription_thread = None
+        # Limpiar referencia a la tarea
+        self.transcription_task = None
         
         self.statusBar().showMessage("Error de transcripción", 3000)
     
+    @pyqtSlot()
     def transcription_cancelled(self):
         """Gestiona cancelación de transcripción"""
         self.progress_bar.setValue(0)
         self.status_label.setText("Transcripción cancelada")
         
         # Restaurar controles
-        self.transcribe_btn.setEnabled(True)
-        self.import_btn.setEnabled(True)
-        self.record_btn.setEnabled(True)
-        self.cancel_btn.setEnabled(False)
+        self.set_transcription_controls(False)
         
-        # Limpiar referencia al hilo
-        self.transcription_thread = None
+        # Limpiar referencia a la tarea
+        self.transcription_task = None
         
         self.statusBar().showMessage("Transcripción cancelada", 3000)
     
+    @pyqtSlot()
     def cancel_transcription(self):
         """Cancela la transcripción en curso"""
-        if not hasattr(self, 'transcriber') or self.transcriber is None or not self.cancel_btn.isEnabled():
+        if self._transcriber is None or not self.cancel_btn.isEnabled():
             return
         
         reply = QMessageBox.question(
@@ -923,104 +1650,95 @@ class MainWindow(QMainWindow):
             self.cancel_btn.setEnabled(False)
     
     def file_selected(self, current, previous):
-        """Gestiona cambio de selección de archivo"""
+        """
+        Gestiona cambio de selección de archivo
+        
+        Los cambios rápidos (p.ej. mantener pulsada una flecha) se agrupan y
+        solo se muestra la selección final.
+        """
+        self.selection_timer.start()
+    
+    def flush_pending_selection(self):
+        """
+        Aplica de inmediato un cambio de selección aún pendiente
+        
+        Las acciones sobre el archivo actual lo llaman primero para que
+        currentItem() y el documento mostrado coincidan.
+        """
+        if self.selection_timer.isActive():
+            self.selection_timer.stop()
+            self.apply_selection()
+    
+    @pyqtSlot()
+    def apply_selection(self):
+        """Muestra el archivo seleccionado tras el retardo de agrupación"""
+        current = self.files_list.currentItem()
+        self.displayed_item = current
         if not current:
             # Limpiar interfaz
-            self.text_edit.clear()
+            self.clear_transcription_text()
             self.info_label.setText("")
             
             # Deshabilitar botones
-            self.export_txt_btn.setEnabled(False)
-            self.export_srt_btn.setEnabled(False)
-            self.export_vtt_btn.setEnabled(False)
-            self.export_all_btn.setEnabled(False)
-            self.edit_btn.setEnabled(False)
+            self.set_button_states(txt=False, srt=False, vtt=False, all=False, edit=False)
             
             return
         
         file_name = current.text()
+        result = self.item_result(current)
         
-        if file_name in self.results:
+        if result is not None:
             # Hay transcripción - mostrarla
-            result = self.results[file_name]
             transcription = result["result"]
             
-            self.text_edit.setPlainText(transcription["text"])
-            
-            # Mostrar información
-            file_info = self.files[file_name]
-            language = transcription.get("language", "desconocido")
-            words = len(transcription["text"].split())
-            duration = transcription.get("duration", 0)
-            duration_str = f"{int(duration // 60)}:{int(duration % 60):02}"
+            self.show_result_text(file_name, transcription["text"])
             
-            # Información de traducción si aplica
-            translation_info = ""
-            if result.get("translated", False):
-                source_lang = result.get("language_source", "desconocido")
-                target_lang = result.get("language_target", "desconocido")
-                translation_info = f"<br><b>Traducción:</b> {source_lang} → {target_lang}"
-            
-            # Mostrar info
-            self.info_label.setText(
-                f"<b>Archivo:</b> {file_name}<br>"
-                f"<b>Idioma detectado:</b> {language}{translation_info}<br>"
-                f"<b>Palabras:</b> {words}<br>"
-                f"<b>Duración:</b> {duration_str}"
-            )
+            # Mostrar información (reutilizando la calculada si existe)
+            self.info_label.setText(self._compute_result_info_html(file_name, result))
             
             # Habilitar botones
-            self.export_txt_btn.setEnabled(True)
-            self.export_srt_btn.setEnabled(True)
-            self.export_vtt_btn.setEnabled(True)
-            self.export_all_btn.setEnabled(True)
-            self.edit_btn.setEnabled(True)
+            self.set_button_states(txt=True, srt=True, vtt=True, all=True, edit=True)
             
         else:
             # No hay transcripción - mostrar información del archivo
-            if file_name in self.files:
-                file_info = self.files[file_name]
-                
-                # Formatear tamaño
-                size_bytes = file_info.get('size', 0)
-                size_str = ""
-                for unit in ['B', 'KB', 'MB', 'GB']:
-                    if size_bytes < 1024.0:
-                        size_str = f"{size_bytes:.2f} {unit}"
-                        break
-                    size_bytes /= 1024.0
-                
-                # Formatear duración
-                duration = file_info.get('duration', 0)
-                if duration:
-                    duration_str = f"{int(duration // 60)}:{int(duration % 60):02}"
-                else:
-                    duration_str = "Desconocida"
-                
-                # Mostrar información
-                self.info_label.setText(
-                    f"<b>Archivo:</b> {file_name}<br>"
-                    f"<b>Ruta:</b> {file_info.get('original_path', '')}<br>"
-                    f"<b>Tamaño:</b> {size_str}<br>"
-                    f"<b>Duración:</b> {duration_str}<br>"
-                    f"<b>Estado:</b> No transcrito"
-                )
+            file_info = self.item_file_info(current)
+            if file_info is not None:
+                self.info_label.setText(self._compute_info_html(file_name, file_info))
             
             # Limpiar área de texto
-            self.text_edit.clear()
+            self.clear_transcription_text()
             
             # Deshabilitar botones de exportación y edición
-            self.export_txt_btn.setEnabled(False)
-            self.export_srt_btn.setEnabled(False)
-            self.export_vtt_btn.setEnabled(False)
-            self.export_all_btn.setEnabled(False)
-            self.edit_btn.setEnabled(False)
+            self.set_button_states(txt=False, srt=False, vtt=False, all=False, edit=False)
         
         # Habilitar transcripción si hay modelo
-        if self.transcriber.model and not self.transcription_thread:
+        if self.has_model() and not self.transcription_task:
             self.transcribe_btn.setEnabled(True)
         else:
             self.transcribe_btn.setEnabled(False)
+        
+        # Preparar la información de los archivos vecinos en tiempo ocioso
+        row = self.files_list.currentRow()
+        QTimer.singleShot(0, lambda r=row: self._prefetch_neighbors(r))
+    
+    def _prefetch_neighbors(self, row):
+        """
+        Precalcula la información HTML de los archivos adyacentes
+        
+        Args:
+            row (int): Fila del archivo seleccionado
+        """
+        for neighbor in (row - 1, row + 1):
+            item = self.files_list.item(neighbor)
+            if item is None:
+                continue
+            result = self.item_result(item)
+            if result is not None:
+                self._compute_result_info_html(item.text(), result)
+                continue
+            file_info = self.item_file_info(item)
+            if file_info is not None:
+                self._compute_info_html(item.text(), file_info)
     
     def show_file_context_menu(self, position):
         """Muestra menú contextual para lista de archivos"""
@@ -1031,55 +1749,51 @@ class MainWindow(QMainWindow):
         if not current_item:
             return
         
-        file_name = current_item.text()
+        if self.file_context_menu is None:
+            self._build_file_context_menu()
         
-        menu = QMenu()
+        # Solo se ajusta el estado de las acciones ya creadas
+        has_result = self.item_result(current_item) is not None
+        self.ctx_transcribe_action.setEnabled(self.transcribe_btn.isEnabled())
+        self.ctx_export_menu.menuAction().setVisible(has_result)
+        self.ctx_edit_action.setVisible(has_result)
         
-        # Acciones para todos los archivos
-        transcribe_action = menu.addAction("Transcribir")
-        transcribe_action.setEnabled(self.transcribe_btn.isEnabled())
+        # Mostrar menú y procesar acción
+        action = self.file_context_menu.exec_(self.files_list.mapToGlobal(position))
+        handler = self.file_context_actions.get(action)
+        if handler is not None:
+            handler()
+    
+    def _build_file_context_menu(self):
+        """Crea una sola vez el menú contextual de la lista de archivos"""
+        menu = QMenu(self)
         
+        # Acciones para todos los archivos
+        self.ctx_transcribe_action = menu.addAction("Transcribir")
         remove_action = menu.addAction("Eliminar de la lista")
         
         menu.addSeparator()
         
         # Acciones específicas para archivos con transcripción
-        if file_name in self.results:
-            export_menu = menu.addMenu("Exportar")
-            export_menu.addAction("Exportar como TXT")
-            export_menu.addAction("Exportar como SRT")
-            export_menu.addAction("Exportar como VTT")
-            export_menu.addAction("Exportar en todos los formatos")
-            
-            edit_action = menu.addAction("Editar transcripción")
-        
-        # Mostrar menú y procesar acción
-        action = menu.exec_(self.files_list.mapToGlobal(position))
-        
-        if not action:
-            return
-        
-        if action == transcribe_action:
-            self.transcribe()
-        
-        elif action == remove_action:
-            self.remove_selected_file()
-        
-        elif action.text() == "Exportar como TXT":
-            self.export_transcription("txt")
-        
-        elif action.text() == "Exportar como SRT":
-            self.export_transcription("srt")
-        
-        elif action.text() == "Exportar como VTT":
-            self.export_transcription("vtt")
-        
-        elif action.text() == "Exportar en todos los formatos":
-            self.export_transcription("all")
-        
-        elif action.text() == "Editar transcripción":
-            self.enable_editing()
+        self.ctx_export_menu = menu.addMenu("Exportar")
+        export_txt = self.ctx_export_menu.addAction("Exportar como TXT")
+        export_srt = self.ctx_export_menu.addAction("Exportar como SRT")
+        export_vtt = self.ctx_export_menu.addAction("Exportar como VTT")
+        export_all = self.ctx_export_menu.addAction("Exportar en todos los formatos")
+        self.ctx_edit_action = menu.addAction("Editar transcripción")
+        
+        self.file_context_actions = {
+            self.ctx_transcribe_action: self.transcribe,
+            remove_action: self.remove_selected_file,
+            export_txt: lambda: self.export_transcription("txt"),
+            export_srt: lambda: self.export_transcription("srt"),
+            export_vtt: lambda: self.export_transcription("vtt"),
+            export_all: lambda: self.export_transcription("all"),
+            self.ctx_edit_action: self.enable_editing,
+        }
+        self.file_context_menu = menu
     
+    @pyqtSlot()
     def remove_selected_file(self):
         """Elimina el archivo seleccionado de la lista"""
         current_item = self.files_list.currentItem()
@@ -1100,20 +1814,18 @@ class MainWindow(QMainWindow):
         if reply != QMessageBox.Yes:
             return
         
-        # Eliminar archivo de listas
-        row = self.files_list.row(current_item)
-        self.files_list.takeItem(row)
+        # Eliminar archivo de listas (la fila actual ya la conoce la vista)
+        self.files_list.takeItem(self.files_list.currentRow())
         
-        # Eliminar resultados y referencias
-        if file_name in self.results:
-            del self.results[file_name]
+        # Eliminar el documento renderizado (el resultado se va con el elemento)
+        self.forget_rendered_text(file_name)
         
         # Eliminar archivo temporal si es una grabación
-        if file_name in self.files:
-            file_info = self.files[file_name]
+        file_info = self.item_file_info(current_item)
+        if file_info is not None:
             if "processed_path" in file_info:
                 file_path = file_info["processed_path"]
-                if file_path.startswith(tempfile.gettempdir()) and os.path.exists(file_path):
+                if self._is_temp_file(file_path) and os.path.exists(file_path):
                     try:
                         os.unlink(file_path)
                         logger.debug(f"Archivo temporal eliminado: {file_path}")
@@ -1121,7 +1833,7 @@ class MainWindow(QMainWindow):
                         logger.warning(f"Error al eliminar archivo temporal: {e}")
             
             # Eliminar de la lista
-            del self.files[file_name]
+            self.files.pop(file_name, None)
         
         # Deshabilitar transcripción si no hay más archivos
         if self.files_list.count() == 0:
@@ -1129,6 +1841,23 @@ class MainWindow(QMainWindow):
         
         self.statusBar().showMessage(f"Archivo '{file_name}' eliminado", 3000)
     
+    def _is_temp_file(self, file_path):
+        """
+        Comprueba si un archivo está dentro del directorio temporal
+        
+        Args:
+            file_path (str): Ruta del archivo
+            
+        Returns:
+            bool: True si el archivo pertenece al directorio temporal
+        """
+        real_path = os.path.realpath(file_path)
+        try:
+            return os.path.commonpath([real_path, self._tempdir]) == self._tempdir
+        except ValueError:
+            # Rutas en unidades distintas (Windows)
+            return False
+    
     def export_transcription(self, format_type="txt"):
         """
         Exporta la transcripción actual
@@ -1136,6 +1865,7 @@ class MainWindow(QMainWindow):
         Args:
             format_type (str): Formato a exportar (txt, srt, vtt, all)
         """
+        self.flush_pending_selection()
         current_item = self.files_list.currentItem()
         if not current_item:
             QMessageBox.warning(
@@ -1146,8 +1876,9 @@ class MainWindow(QMainWindow):
             return
         
         file_name = current_item.text()
+        result = self.item_result(current_item)
         
-        if file_name not in self.results:
+        if result is None:
             QMessageBox.warning(
                 self,
                 "Sin transcripción",
@@ -1155,8 +1886,6 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Obtener resultado
-        result = self.results[file_name]
         transcription = result["result"]
         
         # Determinar formatos a exportar
@@ -1184,31 +1913,33 @@ class MainWindow(QMainWindow):
         # Guardar directorio para próxima vez
         self.config.set("export_directory", os.path.dirname(file_path))
         
-        # Eliminar extensión si se va a exportar en múltiples formatos
-        if len(formats) > 1:
-            file_path = os.path.splitext(file_path)[0]
+        # La exportación añade la extensión de cada formato
+        file_path = os.path.splitext(file_path)[0]
         
-        self.export_txt_btn.setEnabled(False)
-        self.export_srt_btn.setEnabled(False)
-        self.export_vtt_btn.setEnabled(False)
-        self.export_all_btn.setEnabled(False)
+        self.set_button_states(txt=False, srt=False, vtt=False, all=False)
         self.status_label.setText("Exportando transcripción...")
         self.progress_bar.setRange(0, 0)
-        self.export_worker = ExportWorker(self.file_manager, transcription, file_path, formats)
-        self.export_worker.finished.connect(self.on_export_finished)
-        self.export_worker.start()
+        task = ExportTask(self.file_manager, transcription, file_path, formats)
+        task.signals.finished.connect(self._on_export_done)
+        task.signals.error.connect(self._on_export_error)
+        # Mantener viva la tarea hasta que termine
+        self.export_tasks.add(task)
+        task.signals.done.connect(lambda: self.export_tasks.discard(task))
+        QThreadPool.globalInstance().start(task)
 
-    def on_export_finished(self, exported, file_path, formats, error):
-        self.export_txt_btn.setEnabled(True)
-        self.export_srt_btn.setEnabled(True)
-        self.export_vtt_btn.setEnabled(True)
-        self.export_all_btn.setEnabled(True)
+    def _restore_export_controls(self):
+        self.set_button_states(txt=True, srt=True, vtt=True, all=True)
         self.progress_bar.setRange(0, 100)
         self.status_label.setText("Listo")
-        if error:
-            logger.error(f"Error al exportar: {error}")
-            QMessageBox.critical(self, "Error", f"Error al exportar transcripción: {error}")
-            return
+
+    @pyqtSlot(str)
+    def _on_export_error(self, error_msg):
+        self._restore_export_controls()
+        QMessageBox.critical(self, "Error", f"Error al exportar transcripción: {error_msg}")
+
+    @pyqtSlot(dict, str, list)
+    def _on_export_done(self, exported, file_path, formats):
+        self._restore_export_controls()
         if exported:
             formats_str = ", ".join(formats)
             exported_files = ", ".join(exported.values())
@@ -1221,8 +1952,11 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.warning(self, "Error de exportación", "No se pudo exportar la transcripción")
     
+    @pyqtSlot()
     def enable_editing(self):
         """Habilita edición de transcripción"""
+        # Mostrar primero la selección pendiente: se edita lo que se ve
+        self.flush_pending_selection()
         if not self.edit_btn.isEnabled():
             return
         
@@ -1230,16 +1964,20 @@ class MainWindow(QMainWindow):
         if not current_item:
             return
         
-        file_name = current_item.text()
-        if file_name not in self.results:
+        if self.item_result(current_item) is None:
             return
         
-        # Guardar texto original
-        self.original_text = self.text_edit.toPlainText()
+        # Completar la inserción pendiente antes de editar
+        self.flush_text_stream()
+        
+        # El documento editado deja de representar el resultado guardado
+        self.forget_rendered_text(current_item.text())
+        
+        # Marcar el documento como no modificado; el original sigue en los datos del elemento
+        self.text_edit.document().setModified(False)
         
         # Habilitar edición
         self.text_edit.setReadOnly(False)
-        self.text_edit.setStyleSheet("background-color: #FFFFD0;")  # Fondo amarillo claro
         
         # Mostrar advertencia
         QMessageBox.warning(
@@ -1253,31 +1991,28 @@ class MainWindow(QMainWindow):
         )
         
         # Actualizar botones
-        self.edit_btn.setEnabled(False)
-        self.save_edit_btn.setEnabled(True)
-        self.cancel_edit_btn.setEnabled(True)
-        
-        # Deshabilitar botones de exportación SRT/VTT durante edición
-        self.export_srt_btn.setEnabled(False)
-        self.export_vtt_btn.setEnabled(False)
+        self.set_button_states(edit=False, save_edit=True, cancel_edit=True, srt=False, vtt=False)
+        self.text_edit.viewport().setPalette(self._edit_palette)
         
         self.statusBar().showMessage("Modo de edición activado", 3000)
     
+    @pyqtSlot()
     def save_edits(self):
         """Guarda los cambios de edición y actualiza los segmentos"""
-        current_item = self.files_list.currentItem()
+        # El texto editado pertenece al documento mostrado, no a una selección pendiente
+        current_item = self.displayed_item
         if not current_item:
             return
         
-        file_name = current_item.text()
-        if file_name not in self.results:
+        result = self.item_result(current_item)
+        if result is None:
             return
         
         # Obtener texto editado
         edited_text = self.text_edit.toPlainText()
         
         # Verificar si hay cambios
-        if edited_text != self.original_text:
+        if self.text_edit.document().isModified() and edited_text != result["result"]["text"]:
             # Confirmar aplicación de cambios
             reply = QMessageBox.question(
                 self,
@@ -1290,10 +2025,14 @@ class MainWindow(QMainWindow):
             
             if reply == QMessageBox.Yes:
                 # Actualizar texto en el resultado principal
-                self.results[file_name]["result"]["text"] = edited_text
+                result["result"]["text"] = edited_text
+                # El recuento y las palabras clave cambiaron: invalidar la información guardada
+                self.update_text_stats(result["result"])
+                result.pop('keywords', None)
+                result.pop('_info_html', None)
                 
                 # Actualizar segmentos con el nuevo texto si es posible
-                if "segments" in self.results[file_name]["result"]:
+                if "segments" in result["result"]:
                     # Mostrar advertencia sobre limitaciones
                     QMessageBox.information(
                         self,
@@ -1308,38 +2047,42 @@ class MainWindow(QMainWindow):
         
         # Restaurar estado de edición
         self.text_edit.setReadOnly(True)
-        self.text_edit.setStyleSheet("")  # Restablecer estilo
         
         # Actualizar botones
-        self.edit_btn.setEnabled(True)
-        self.save_edit_btn.setEnabled(False)
-        self.cancel_edit_btn.setEnabled(False)
-        
-        # Reactivar botones de exportación
-        self.export_txt_btn.setEnabled(True)
-        self.export_srt_btn.setEnabled(True)
-        self.export_vtt_btn.setEnabled(True)
-        self.export_all_btn.setEnabled(True)
+        self.set_button_states(
+            edit=True,
+            save_edit=False,
+            cancel_edit=False,
+            txt=True,
+            srt=True,
+            vtt=True,
+            all=True
+        )
+        self.text_edit.viewport().setPalette(self._normal_palette)
     
+    @pyqtSlot()
     def cancel_editing(self):
         """Cancela la edición y restaura texto original"""
-        # Restaurar texto original
-        self.text_edit.setPlainText(self.original_text)
+        # Restaurar texto original desde el resultado guardado del documento mostrado
+        current_item = self.displayed_item
+        result = self.item_result(current_item)
+        if result is not None:
+            self.show_result_text(current_item.text(), result["result"]["text"])
         
         # Restablecer estado de edición
         self.text_edit.setReadOnly(True)
-        self.text_edit.setStyleSheet("")  # Restablecer estilo
         
         # Actualizar botones
-        self.edit_btn.setEnabled(True)
-        self.save_edit_btn.setEnabled(False)
-        self.cancel_edit_btn.setEnabled(False)
-        
-        # Reactivar botones de exportación
-        self.export_txt_btn.setEnabled(True)
-        self.export_srt_btn.setEnabled(True)
-        self.export_vtt_btn.setEnabled(True)
-        self.export_all_btn.setEnabled(True)
+        self.set_button_states(
+            edit=True,
+            save_edit=False,
+            cancel_edit=False,
+            txt=True,
+            srt=True,
+            vtt=True,
+            all=True
+        )
+        self.text_edit.viewport().setPalette(self._normal_palette)
         
         self.statusBar().showMessage("Edición cancelada", 3000)
     
@@ -1347,6 +2090,8 @@ class MainWindow(QMainWindow):
         """Muestra diálogo de configuración"""
         dialog = ConfigDialog(self.config, self)
         dialog.exec_()
+        # La ruta de FFMPEG puede haber cambiado
+        reset_ffmpeg_check()
     
     def show_audio_devices(self):
         """Muestra diálogo de selección de dispositivos de audio"""
@@ -1366,7 +2111,7 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Gestiona cierre de la aplicación"""
         # Verificar si hay procesos activos
-        if self.transcription_thread is not None and self.transcription_thread.isRunning():
+        if self.transcription_task is not None:
             reply = QMessageBox.question(
                 self,
                 "Confirmar salida",
@@ -1383,7 +2128,7 @@ class MainWindow(QMainWindow):
             self.transcriber.cancel()
         
         # Verificar si hay grabación activa
-        if self.recorder.is_active():
+        if self.is_recording():
             reply = QMessageBox.question(
                 self,
                 "Confirmar salida",
@@ -1400,7 +2145,8 @@ class MainWindow(QMainWindow):
             self.recorder.stop_recording()
         
         # Limpiar archivos temporales
-        self.file_manager.cleanup_temp_files()
+        if self._file_manager is not None:
+            self._file_manager.cleanup_temp_files()
         
         # Permitir cierre
         event.accept()
@@ -1429,7 +2175,7 @@ class MainWindow(QMainWindow):
         self.dictation_clear_btn.clicked.connect(self.clear_dictation)
         dictation_controls.addWidget(self.dictation_clear_btn)
         dictation_layout.addLayout(dictation_controls)
-        self.dictation_text = QTextEdit()
+        self.dictation_text = QPlainTextEdit()
         self.dictation_text.setReadOnly(True)
         self.dictation_text.setPlaceholderText("El texto dictado aparecerá aquí en tiempo real...")
         dictation_layout.addWidget(self.dictation_text)
@@ -1448,10 +2194,10 @@ class MainWindow(QMainWindow):
 
     def toggle_dictation_mode(self):
         """Alterna entre modo normal y modo dictado"""
-        if not hasattr(self, 'dictation_widget'):
+        if self.dictation_widget is None:
             self.setup_dictation_ui()
         if self.dictation_widget.isHidden():
-            if not self.transcriber.model:
+            if not self.has_model():
                 reply = QMessageBox.question(
                     self,
                     "Cargar Modelo",
@@ -1463,46 +2209,37 @@ class MainWindow(QMainWindow):
                     self.load_model()
                 else:
                     return
-            if not hasattr(self, 'realtime_transcriber'):
+            if self.realtime_transcriber is None:
+                from whisper_app.core.realtime_transcriber import RealtimeTranscriber
                 self.realtime_transcriber = RealtimeTranscriber(self.transcriber, self.config)
                 self.realtime_transcriber.signals.progress.connect(self.update_dictation_text)
                 self.realtime_transcriber.signals.finished.connect(self.dictation_finished)
                 self.realtime_transcriber.signals.error.connect(self.dictation_error)
-                self.recorder.signals.recording_chunk.connect(self.realtime_transcriber.add_audio_chunk)
-            central_layout = self.centralWidget().layout()
-            if not hasattr(self, 'main_content_widget'):
-                for i in range(central_layout.count()):
-                    item = central_layout.itemAt(i)
-                    if item and item.widget() and isinstance(item.widget(), QSplitter):
-                        self.main_content_widget = item.widget()
-                        break
-            if hasattr(self, 'main_content_widget'):
-                self.main_content_widget.hide()
-            dictation_in_layout = False
-            for i in range(central_layout.count()):
-                if central_layout.itemAt(i).widget() == self.dictation_widget:
-                    dictation_in_layout = True
-                    break
-            if not dictation_in_layout:
-                central_layout.addWidget(self.dictation_widget, 1)
+                # Conexión directa: el fragmento se encola desde el hilo de audio
+                # sin pasar por la cola de eventos de la interfaz
+                self.recorder.signals.recording_chunk.connect(
+                    self.realtime_transcriber.add_audio_chunk, Qt.DirectConnection
+                )
+            self.realtime_transcriber.warm_up()
+            self.main_content_widget.hide()
+            if self.dictation_widget.parentWidget() is not self.centralWidget():
+                self.centralWidget().layout().addWidget(self.dictation_widget, 1)
             self.dictation_widget.show()
             self.setWindowTitle("WhisperApp - Modo Dictado en Tiempo Real")
-            if hasattr(self, 'dictation_mode_action'):
-                self.dictation_mode_action.setText("Volver a Modo Normal")
+            self.dictation_mode_action.setText("Volver a Modo Normal")
         else:
-            if hasattr(self, 'main_content_widget'):
-                if hasattr(self, 'is_dictating') and self.is_dictating:
-                    self.toggle_dictation()
-                self.dictation_widget.hide()
-                self.main_content_widget.show()
-                self.setWindowTitle("WhisperApp - Transcripción de Audio/Video")
-                if hasattr(self, 'dictation_mode_action'):
-                    self.dictation_mode_action.setText("Modo Dictado en Tiempo Real")
+            if self.is_dictating:
+                self.toggle_dictation()
+            self.dictation_widget.hide()
+            self.main_content_widget.show()
+            self.setWindowTitle("WhisperApp - Transcripción de Audio/Video")
+            self.dictation_mode_action.setText("Modo Dictado en Tiempo Real")
 
+    @pyqtSlot()
     def toggle_dictation(self):
         """Inicia o detiene el dictado en tiempo real"""
-        if not hasattr(self, 'is_dictating') or not self.is_dictating:
-            if not self.transcriber.model:
+        if not self.is_dictating:
+            if not self.has_model():
                 QMessageBox.warning(
                     self,
                     "Modelo no cargado",
@@ -1511,8 +2248,7 @@ class MainWindow(QMainWindow):
                 return
             success = self.recorder.start_streaming_recording()
             if not success:
-                QMessageBox.critical(
-                    self,
+                self.show_dictation_error(
                     "Error de Grabación",
                     "No se pudo iniciar la grabación para dictado.\n\nVerifica tu micrófono y los permisos."
                 )
@@ -1530,49 +2266,80 @@ class MainWindow(QMainWindow):
             self.is_dictating = False
             self.start_dictation_btn.setText("Iniciar Dictado")
             self.dictation_pause_btn.setEnabled(False)
+            self.set_dictation_paused(False)
             self.dictation_status.setText("Dictado detenido")
             self.dictation_status.setStyleSheet("color: #666; font-style: italic;")
             self.statusBar().showMessage("Dictado detenido", 3000)
 
+    @pyqtSlot()
     def pause_dictation(self):
         """Pausa o reanuda el dictado"""
-        if self.dictation_pause_btn.text() == "Pausar":
-            self.dictation_pause_btn.setText("Reanudar")
+        if not self.dictation_paused:
+            self.set_dictation_paused(True)
             self.dictation_status.setText("Dictado en pausa")
             self.recorder.stop_recording()
         else:
-            self.dictation_pause_btn.setText("Pausar")
+            self.set_dictation_paused(False)
             self.dictation_status.setText("Dictado activo")
             self.recorder.start_streaming_recording()
 
+    def set_dictation_paused(self, paused):
+        """
+        Registra el estado de pausa del dictado y actualiza el botón
+        
+        Args:
+            paused (bool): True si el dictado queda en pausa
+        """
+        if paused == self.dictation_paused:
+            return
+        self.dictation_paused = paused
+        self.dictation_pause_btn.setText("Reanudar" if paused else "Pausar")
+
+    @pyqtSlot(str)
     def update_dictation_text(self, text):
-        """Actualiza el texto en el área de dictado"""
-        self.dictation_text.setPlainText(text)
-        cursor = self.dictation_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
+        """
+        Actualiza el texto en el área de dictado
+        
+        Si el texto nuevo amplía el anterior solo se inserta el sufijo;
+        si el transcriptor reescribió texto previo se reemplaza completo.
+        """
+        last_text = self.dictation_last_text
+        if last_text and text.startswith(last_text):
+            cursor = self.dictation_text.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text[len(last_text):])
+        else:
+            self.dictation_text.setPlainText(text)
+            cursor = self.dictation_text.textCursor()
+            cursor.movePosition(QTextCursor.End)
         self.dictation_text.setTextCursor(cursor)
+        self.dictation_last_text = text
 
+    @pyqtSlot(str)
     def dictation_finished(self, text):
         """Gestiona la finalización del dictado"""
         self.dictation_text.setPlainText(text)
+        self.dictation_last_text = ""
         self.dictation_status.setText("Dictado completado")
         self.dictation_status.setStyleSheet("color: #060;")
         self.dictation_export_txt_btn.setEnabled(True)
         self.dictation_to_editor_btn.setEnabled(True)
 
+    @pyqtSlot(str)
     def dictation_error(self, error_msg):
         """Gestiona errores durante el dictado"""
-        QMessageBox.critical(
-            self,
+        self.show_dictation_error(
             "Error de Dictado",
             f"Error durante el dictado en tiempo real:\n\n{error_msg}"
         )
         self.is_dictating = False
         self.start_dictation_btn.setText("Iniciar Dictado")
         self.dictation_pause_btn.setEnabled(False)
+        self.set_dictation_paused(False)
         self.dictation_status.setText("Error en dictado")
         self.dictation_status.setStyleSheet("color: #c00;")
 
+    @pyqtSlot()
     def clear_dictation(self):
         """Limpia el texto de dictado"""
         reply = QMessageBox.question(
@@ -1584,13 +2351,14 @@ class MainWindow(QMainWindow):
         )
         if reply == QMessageBox.Yes:
             self.dictation_text.clear()
-            if hasattr(self, 'realtime_transcriber'):
+            self.dictation_last_text = ""
+            if self.realtime_transcriber is not None:
                 self.realtime_transcriber.accumulated_text = ""
 
     def export_dictation(self, format_type="txt"):
         """Exporta el texto dictado a un archivo"""
-        text = self.dictation_text.toPlainText()
-        if not text:
+        document = self.dictation_text.document()
+        if document.isEmpty():
             QMessageBox.warning(
                 self,
                 "Sin contenido",
@@ -1607,8 +2375,14 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(text)
+            # Escribir bloque a bloque para no duplicar el documento en memoria
+            with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                block = document.begin()
+                while block.isValid():
+                    f.write(block.text())
+                    block = block.next()
+                    if block.isValid():
+                        f.write("\n")
             QMessageBox.information(
                 self,
                 "Exportación completada",
@@ -1616,12 +2390,35 @@ class MainWindow(QMainWindow):
             )
             self.statusBar().showMessage(f"Dictado exportado como {format_type.upper()}", 3000)
         except Exception as e:
-            QMessageBox.critical(
-                self,
+            self.show_dictation_error(
                 "Error al exportar",
                 f"No se pudo guardar el archivo:\n\n{e}"
             )
 
+    def show_dictation_error(self, title, message):
+        """
+        Muestra un error del modo dictado en un único cuadro reutilizable
+        
+        El cuadro no es modal: si llegan varios errores seguidos se actualiza
+        el texto del mismo cuadro en lugar de apilar diálogos.
+        
+        Args:
+            title (str): Título del cuadro
+            message (str): Mensaje de error
+        """
+        box = self.dictation_error_box
+        if box is None:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Critical)
+            box.setStandardButtons(QMessageBox.Ok)
+            box.setModal(False)
+            self.dictation_error_box = box
+        box.setWindowTitle(title)
+        box.setText(message)
+        box.show()
+        box.raise_()
+
+    @pyqtSlot()
     def dictation_to_editor(self):
         """Envía el texto dictado al editor de transcripción"""
         text = self.dictation_text.toPlainText()
@@ -1643,6 +2440,6 @@ class MainWindow(QMainWindow):
             if reply != QMessageBox.Yes:
                 return
         self.toggle_dictation_mode()
-        self.text_edit.setPlainText(text)
+        self.set_transcription_text(text)
         self.enable_editing()
         self.statusBar().showMessage("Texto dictado enviado al editor", 3000)
\ No newline at end of file
@@ -7,6 +7,213 @@ from PyQt5.QtGui import QPalette, QColor, QIcon
 from PyQt5.QtCore import Qt
 
 
+# Paletas de los temas, construidas al primer uso (requieren QApplication)
+_PALETTE_CACHE = {}
+
+# Hoja de estilos del tema oscuro elegante
+ELEGANT_DARK_QSS = """
+    QMainWindow, QDialog {
+        background-color: #1e1e1e;
+    }
+    
+    QWidget {
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    
+    QPushButton {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px 12px;
+        min-width: 80px;
+    }
+    
+    QPushButton:hover {
+        background-color: #353535;
+        border-color: #3DAEE9;
+    }
+    
+    QPushButton:pressed {
+        background-color: #383838;
+    }
+    
+    QPushButton:disabled {
+        background-color: #2d2d2d;
+        color: #808080;
+        border-color: #3d3d3d;
+    }
+    
+    QComboBox, QLineEdit, QSpinBox, QDoubleSpinBox, QTextEdit, QPlainTextEdit {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 3px;
+        selection-background-color: #3DAEE9;
+    }
+    
+    QComboBox:hover, QLineEdit:hover, QSpinBox:hover, QDoubleSpinBox:hover {
+        border-color: #3DAEE9;
+    }
+    
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+    
+    QProgressBar {
+        border: 1px solid #3d3d3d;
+        border-radius: 3px;
+        text-align: center;
+        background-color: #2d2d2d;
+    }
+    
+    QProgressBar::chunk {
+        background-color: #3DAEE9;
+        width: 10px;
+    }
+    
+    QTabWidget::pane {
+        border: 1px solid #3d3d3d;
+    }
+    
+    QTabBar::tab {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        border-bottom: none;
+        min-width: 8ex;
+        padding: 6px;
+    }
+    
+    QTabBar::tab:selected {
+        background-color: #3d3d3d;
+        border-bottom: 1px solid #3DAEE9;
+    }
+    
+    QTabBar::tab:!selected {
+        margin-top: 2px;
+    }
+    
+    QListWidget, QTreeWidget, QTableWidget {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        alternate-background-color: #353535;
+    }
+    
+    QListWidget::item:selected, QTreeWidget::item:selected, QTableWidget::item:selected {
+        background-color: #3DAEE9;
+        color: white;
+    }
+    
+    QListWidget::item:hover, QTreeWidget::item:hover, QTableWidget::item:hover {
+        background-color: #353535;
+    }
+    
+    QGroupBox {
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        margin-top: 16px;
+        font-weight: bold;
+    }
+    
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        left: 10px;
+        padding: 0 5px;
+    }
+    
+    QSplitter::handle {
+        background-color: #3d3d3d;
+    }
+    
+    QScrollBar:vertical {
+        border: none;
+        background-color: #2d2d2d;
+        width: 10px;
+        margin: 0px;
+    }
+    
+    QScrollBar::handle:vertical {
+        background-color: #3d3d3d;
+        min-height: 20px;
+        border-radius: 5px;
+    }
+    
+    QScrollBar::handle:vertical:hover {
+        background-color: #3DAEE9;
+    }
+    
+    QScrollBar:horizontal {
+        border: none;
+        background-color: #2d2d2d;
+        height: 10px;
+        margin: 0px;
+    }
+    
+    QScrollBar::handle:horizontal {
+        background-color: #3d3d3d;
+        min-width: 20px;
+        border-radius: 5px;
+    }
+    
+    QScrollBar::handle:horizontal:hover {
+        background-color: #3DAEE9;
+    }
+    
+    QMenuBar {
+        background-color: #222222;
+        color: #f0f0f0;
+        border-bottom: 1px solid #3d3d3d;
+    }
+    
+    QMenuBar::item {
+        background: transparent;
+    }
+    
+    QMenuBar::item:selected {
+        background: #3d3d3d;
+    }
+    
+    QMenu {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+    }
+    
+    QMenu::item {
+        padding: 5px 20px 5px 20px;
+    }
+    
+    QMenu::item:selected {
+        background-color: #3DAEE9;
+        color: white;
+    }
+    
+    QMenu::separator {
+        height: 1px;
+        background: #3d3d3d;
+        margin: 5px;
+    }
+    
+    QStatusBar {
+        background-color: #222222;
+        color: #f0f0f0;
+        border-top: 1px solid #3d3d3d;
+    }
+    
+    AudioLevelMeter QProgressBar {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+    }
+    
+    AudioLevelMeter QProgressBar::chunk {
+        background-color: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #0a8, stop:0.7 #0d0, stop:1 #f00
+        );
+    }
+"""
+
+
 def apply_theme(app, theme="dark"):
     """
     Aplica un tema a toda la aplicación
@@ -38,9 +245,32 @@ def _apply_light_theme(app):
     app.setStyleSheet("")
 
 
+def _cached_palette(name, builder):
+    """
+    Devuelve la paleta de un tema, construyéndola solo la primera vez
+    
+    Args:
+        name (str): Nombre del tema
+        builder: Función que construye la QPalette
+        
+    Returns:
+        QPalette: Paleta del tema
+    """
+    palette = _PALETTE_CACHE.get(name)
+    if palette is None:
+        palette = builder()
+        _PALETTE_CACHE[name] = palette
+    return palette
+
+
 def _apply_dark_theme(app):
     """Aplica tema oscuro básico (Fusion)"""
     app.setStyle("Fusion")
+    app.setPalette(_cached_palette("dark", _build_dark_palette))
+
+
+def _build_dark_palette():
+    """Construye la paleta del tema oscuro básico"""
     palette = QPalette()
     
     # Colores base oscuros
@@ -65,13 +295,23 @@ def _apply_dark_theme(app):
     palette.setColor(QPalette.HighlightedText, Qt.black)
     palette.setColor(QPalette.Disabled, QPalette.Highlight, disabled_color)
     
-    app.setPalette(palette)
+    return palette
 
 
 def _apply_elegant_dark_theme(app):
     """Aplica tema oscuro elegante y moderno con acentos de color"""
     app.setStyle("Fusion")
+    app.setPalette(_cached_palette("elegant_dark", _build_elegant_dark_palette))
     
+    # Estilos adicionales con CSS para perfeccionar la apariencia.
+    # Reaplicar la misma hoja obliga a Qt a volver a analizarla y repulir
+    # todos los widgets, por lo que se omite si ya está activa.
+    if app.styleSheet() != ELEGANT_DARK_QSS:
+        app.setStyleSheet(ELEGANT_DARK_QSS)
+
+
+def _build_elegant_dark_palette():
+    """Construye la paleta del tema oscuro elegante"""
     # Color principal de acento
     accent_color = QColor(61, 174, 233)  # Azul elegante
     accent_disabled = QColor(40, 110, 150)
@@ -102,210 +342,7 @@ def _apply_elegant_dark_theme(app):
     palette.setColor(QPalette.HighlightedText, Qt.white)
     palette.setColor(QPalette.Disabled, QPalette.Highlight, accent_disabled)
     
-    app.setPalette(palette)
-    
-    # Estilos adicionales con CSS para perfeccionar la apariencia
-    app.setStyleSheet("""
-        QMainWindow, QDialog {
-            background-color: #1e1e1e;
-        }
-        
-        QWidget {
-            font-family: 'Segoe UI', Arial, sans-serif;
-        }
-        
-        QPushButton {
-            background-color: #2d2d2d;
-            border: 1px solid #3d3d3d;
-            border-radius: 4px;
-            padding: 6px 12px;
-            min-width: 80px;
-        }
-        
-        QPushButton:hover {
-            background-color: #353535;
-            border-color: #3DAEE9;
-        }
-        
-        QPushButton:pressed {
-            background-color: #383838;
-        }
-        
-        QPushButton:disabled {
-            background-color: #2d2d2d;
-            color: #808080;
-            border-color: #3d3d3d;
-        }
-        
-        QComboBox, QLineEdit, QSpinBox, QDoubleSpinBox, QTextEdit {
-            background-color: #2d2d2d;
-            border: 1px solid #3d3d3d;
-            border-radius: 4px;
-            padding: 3px;
-            selection-background-color: #3DAEE9;
-        }
-        
-        QComboBox:hover, QLineEdit:hover, QSpinBox:hover, QDoubleSpinBox:hover {
-            border-color: #3DAEE9;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 20px;
-        }
-        
-        QProgressBar {
-            border: 1px solid #3d3d3d;
-            border-radius: 3px;
-            text-align: center;
-            background-color: #2d2d2d;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #3DAEE9;
-            width: 10px;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #3d3d3d;
-        }
-        
-        QTabBar::tab {
-            background-color: #2d2d2d;
-            border: 1px solid #3d3d3d;
-            border-bottom: none;
-            min-width: 8ex;
-            padding: 6px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #3d3d3d;
-            border-bottom: 1px solid #3DAEE9;
-        }
-        
-        QTabBar::tab:!selected {
-            margin-top: 2px;
-        }
-        
-        QListWidget, QTreeWidget, QTableWidget {
-            background-color: #2d2d2d;
-            border: 1px solid #3d3d3d;
-            alternate-background-color: #353535;
-        }
-        
-        QListWidget::item:selected, QTreeWidget::item:selected, QTableWidget::item:selected {
-            background-color: #3DAEE9;
-            color: white;
-        }
-        
-        QListWidget::item:hover, QTreeWidget::item:hover, QTableWidget::item:hover {
-            background-color: #353535;
-        }
-        
-        QGroupBox {
-            border: 1px solid #3d3d3d;
-            border-radius: 4px;
-            margin-top: 16px;
-            font-weight: bold;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            left: 10px;
-            padding: 0 5px;
-        }
-        
-        QSplitter::handle {
-            background-color: #3d3d3d;
-        }
-        
-        QScrollBar:vertical {
-            border: none;
-            background-color: #2d2d2d;
-            width: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #3d3d3d;
-            min-height: 20px;
-            border-radius: 5px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #3DAEE9;
-        }
-        
-        QScrollBar:horizontal {
-            border: none;
-            background-color: #2d2d2d;
-            height: 10px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:horizontal {
-            background-color: #3d3d3d;
-            min-width: 20px;
-            border-radius: 5px;
-        }
-        
-        QScrollBar::handle:horizontal:hover {
-            background-color: #3DAEE9;
-        }
-        
-        QMenuBar {
-            background-color: #222222;
-            color: #f0f0f0;
-            border-bottom: 1px solid #3d3d3d;
-        }
-        
-        QMenuBar::item {
-            background: transparent;
-        }
-        
-        QMenuBar::item:selected {
-            background: #3d3d3d;
-        }
-        
-        QMenu {
-            background-color: #2d2d2d;
-            border: 1px solid #3d3d3d;
-        }
-        
-        QMenu::item {
-            padding: 5px 20px 5px 20px;
-        }
-        
-        QMenu::item:selected {
-            background-color: #3DAEE9;
-            color: white;
-        }
-        
-        QMenu::separator {
-            height: 1px;
-            background: #3d3d3d;
-            margin: 5px;
-        }
-        
-        QStatusBar {
-            background-color: #222222;
-            color: #f0f0f0;
-            border-top: 1px solid #3d3d3d;
-        }
-        
-        AudioLevelMeter QProgressBar {
-            background-color: #2d2d2d;
-            border: 1px solid #3d3d3d;
-        }
-        
-        AudioLevelMeter QProgressBar::chunk {
-            background-color: qlineargradient(
-                x1:0, y1:0, x2:1, y2:0,
-                stop:0 #0a8, stop:0.7 #0d0, stop:1 #f00
-            );
-        }
-    """)
+    return palette
 
 
 # Paleta de colores elegante para referencia
@@ -4,14 +4,41 @@
 Widgets personalizados para WhisperApp
 """
 
+import os
+
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QProgressBar, QVBoxLayout, QHBoxLayout,
     QPushButton, QSlider, QSpinBox, QComboBox, QCheckBox,
-    QListWidget, QListWidgetItem, QStyle
+    QListWidget, QListWidgetItem, QStyle, QApplication
 )
 from PyQt5.QtCore import Qt, QSize, pyqtSignal
 from PyQt5.QtGui import QIcon, QPixmap
 
+# Extensiones reconocidas para elegir el icono de cada archivo
+_AUDIO_EXTS = frozenset(('mp3', 'wav', 'm4a', 'ogg', 'flac'))
+_VIDEO_EXTS = frozenset(('mp4', 'mov', 'avi', 'mkv', 'webm'))
+
+# Iconos estándar ya resueltos, por identificador de QStyle
+_ICON_CACHE = {}
+
+
+def _standard_icon(pixmap):
+    """
+    Obtiene un icono estándar del estilo, resolviéndolo una sola vez
+    
+    Args:
+        pixmap (QStyle.StandardPixmap): Identificador del icono
+        
+    Returns:
+        QIcon: Icono del estilo actual
+    """
+    icon = _ICON_CACHE.get(pixmap)
+    if icon is None:
+        icon = QApplication.style().standardIcon(pixmap)
+        _ICON_CACHE[pixmap] = icon
+    return icon
+
+
 class AudioLevelMeter(QWidget):
     """Widget para mostrar nivel de audio"""
     
@@ -21,6 +48,7 @@ class AudioLevelMeter(QWidget):
         self.level = 0.0
         self.peak_level = 0.0
         self.decay_rate = 0.05
+        self.shown_percent = 0
         
         self.setup_ui()
     
@@ -49,11 +77,14 @@ class AudioLevelMeter(QWidget):
         Args:
             level (float): Nivel de audio (0.0 a 1.0)
         """
-        # Convertir a porcentaje
-        percent = min(100, int(level * 100))
+        # Convertir a porcentaje (0-100)
+        percent = int(level * 100)
+        percent = 100 if percent > 100 else (0 if percent < 0 else percent)
         
-        # Actualizar barra
-        self.level_bar.setValue(percent)
+        # Actualizar barra solo si el valor mostrado cambia
+        if percent != self.shown_percent:
+            self.level_bar.setValue(percent)
+            self.shown_percent = percent
         
         # Actualizar pico si es necesario
         if percent > self.peak_level:
@@ -80,11 +111,11 @@ class FileListItem(QListWidgetItem):
         self.file_info = file_info or {}
         
         # Establecer icono según tipo de archivo
-        ext = file_name.split('.')[-1].lower() if '.' in file_name else ''
+        ext = os.path.splitext(file_name)[1][1:].lower()
         
-        if ext in ['mp3', 'wav', 'm4a', 'ogg', 'flac']:
-            self.setIcon(QStyle.standardIcon(QStyle.SP_MediaVolume))
-        elif ext in ['mp4', 'mov', 'avi', 'mkv', 'webm']:
-            self.setIcon(QStyle.standardIcon(QStyle.SP_MediaPlay))
+        if ext in _AUDIO_EXTS:
+            self.setIcon(_standard_icon(QStyle.SP_MediaVolume))
+        elif ext in _VIDEO_EXTS:
+            self.setIcon(_standard_icon(QStyle.SP_MediaPlay))
         else:
-            self.setIcon(QStyle.standardIcon(QStyle.SP_FileIcon))
\ No newline at end of file
+            self.setIcon(_standard_icon(QStyle.SP_FileIcon))
\ No newline at end of file
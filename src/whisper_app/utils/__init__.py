@@ -9,33 +9,57 @@ Contiene utilidades auxiliares para:
 - Formatear texto y subtítulos
 """
 
-from whisper_app.utils.ffmpeg_utils import (
-    verify_ffmpeg,
-    find_ffmpeg,
-    get_file_info,
-    get_file_duration,
-    convert_to_wav,
-    extract_audio,
-    segment_audio
-)
-
-from whisper_app.utils.audio_utils import (
-    apply_vad,
-    normalize_audio,
-    load_audio,
-    save_audio,
-    detect_voice_segments
-)
-
-from whisper_app.utils.text_utils import (
-    save_txt,
-    save_srt,
-    save_vtt,
-    format_timestamp_srt,
-    format_timestamp_vtt,
-    clean_text,
-    merge_segments,
-    label_segments_by_pause,
-    split_long_segments,
-    extract_keywords
-)
\ No newline at end of file
+import importlib
+
+# Los submódulos se cargan al acceder al primer símbolo que exportan
+# (PEP 562), para no importar numpy/scipy al arrancar si no hacen falta.
+_LAZY_EXPORTS = {
+    'ffmpeg_utils': (
+        'verify_ffmpeg',
+        'find_ffmpeg',
+        'get_file_info',
+        'get_file_duration',
+        'convert_to_wav',
+        'extract_audio',
+        'segment_audio',
+    ),
+    'audio_utils': (
+        'apply_vad',
+        'normalize_audio',
+        'load_audio',
+        'save_audio',
+        'detect_voice_segments',
+    ),
+    'text_utils': (
+        'save_txt',
+        'save_srt',
+        'save_vtt',
+        'format_timestamp_srt',
+        'format_timestamp_vtt',
+        'clean_text',
+        'merge_segments',
+        'label_segments_by_pause',
+        'split_long_segments',
+        'extract_keywords',
+    ),
+}
+
+_LAZY_NAMES = {
+    name: module for module, names in _LAZY_EXPORTS.items() for name in names
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
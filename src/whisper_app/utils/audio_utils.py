@@ -5,6 +5,7 @@ Utilidades para procesamiento de audio en WhisperApp
 """
 
 import os
+import math
 import logging
 import tempfile
 import subprocess
@@ -194,6 +195,28 @@ def normalize_audio(file_path: str, output_dir: str, ffmpeg_path: str = None) ->
             except OSError as rm_err: logger.warning(f"Error al eliminar temp: {rm_err}")
         raise FileProcessingError(f"Error inesperado al normalizar: {e}") from e
 
+def resample_audio(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """
+    Cambia la tasa de muestreo de un array de audio.
+
+    Usa un filtro polifásico (resample_poly) con la razón entera reducida
+    entre ambas tasas, mucho más rápido que el remuestreo por FFT de la
+    señal completa en grabaciones largas.
+
+    Args:
+        audio (np.ndarray): Muestras (en el eje 0).
+        orig_sr (int): Tasa de muestreo original.
+        target_sr (int): Tasa de muestreo deseada.
+
+    Returns:
+        np.ndarray: Audio remuestreado en float32.
+    """
+    if orig_sr == target_sr:
+        return audio
+    divisor = math.gcd(int(orig_sr), int(target_sr))
+    resampled = signal.resample_poly(audio, target_sr // divisor, orig_sr // divisor, axis=0)
+    return resampled.astype(np.float32, copy=False)
+
 def load_audio(file_path: str, sample_rate: int = 16000) -> np.ndarray | None:
     """
     Carga un archivo de audio y lo convierte a la tasa de muestreo deseada.
@@ -224,7 +247,7 @@ def load_audio(file_path: str, sample_rate: int = 16000) -> np.ndarray | None:
                 audio = f.read(dtype='float32')
                 sr = f.samplerate
                 if sr != sample_rate:
-                    audio = signal.resample(audio, int(len(audio) * sample_rate / sr))
+                    audio = resample_audio(audio, sr, sample_rate)
                 return audio
         except sf.SoundFileError:
             logger.debug(f"Soundfile no soporta {file_path}, intentando con FFMPEG")
@@ -247,7 +270,7 @@ def load_audio(file_path: str, sample_rate: int = 16000) -> np.ndarray | None:
                     audio = f.read(dtype='float32')
                     sr = f.samplerate
                     if sr != sample_rate:
-                        audio = signal.resample(audio, int(len(audio) * sample_rate / sr))
+                        audio = resample_audio(audio, sr, sample_rate)
                     return audio
             except (FFMpegError, FileNotFoundError, sf.SoundFileError) as convert_err:
                  logger.error(f"Error al convertir/cargar con FFMPEG: {convert_err}")
@@ -111,13 +111,28 @@ def verify_ffprobe():
         logger.warning("ffprobe no encontrado en el sistema")
         return False
 
+# Resultado positivo de verify_ffmpeg_components (evita lanzar procesos en cada importación)
+_components_verified = False
+
 def verify_ffmpeg_components():
     """
     Verifica que tanto ffmpeg como ffprobe estén disponibles
+    
+    Un resultado positivo se recuerda durante toda la ejecución; uno negativo
+    se vuelve a comprobar en la siguiente llamada (p.ej. tras instalar FFMPEG).
+    
     Returns:
         bool: True si ambos están disponibles, False si no
     """
-    return verify_ffmpeg() and verify_ffprobe()
+    global _components_verified
+    if not _components_verified:
+        _components_verified = verify_ffmpeg() and verify_ffprobe()
+    return _components_verified
+
+def reset_ffmpeg_check():
+    """Olvida la verificación de FFMPEG para volver a comprobarlo"""
+    global _components_verified
+    _components_verified = False
 
 def get_file_info(file_path):
     """
@@ -7,12 +7,20 @@ Utilidades para formateo de texto y subtítulos en WhisperApp
 import os
 import logging
 import re
+from collections import Counter
+from contextlib import ExitStack
 
 # Importamos la función para obtener stopwords desde el nuevo módulo
 from whisper_app.utils.language_data import get_stopwords
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r'\S+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+# Búfer de escritura de las exportaciones (menos llamadas al sistema por segmento)
+EXPORT_BUFFER_SIZE = 64 * 1024
+
 def save_txt(transcription, file_path):
     """
     Guarda transcripción en formato de texto plano (TXT)
@@ -105,6 +113,64 @@ def save_vtt(transcription, file_path):
         logger.error(f"Error al guardar VTT: {e}")
         return None
 
+def save_formats(transcription, path_base, formats=("txt", "srt", "vtt")):
+    """
+    Guarda una transcripción en varios formatos en una sola pasada
+    
+    Los segmentos se recorren una vez y cada uno se escribe a la vez en los
+    archivos SRT y VTT abiertos; el contenido es idéntico al de save_txt,
+    save_srt y save_vtt.
+    
+    Args:
+        transcription (dict): Resultado de transcripción de Whisper
+        path_base (str): Ruta base sin extensión
+        formats (iterable): Formatos a generar ('txt', 'srt', 'vtt')
+    
+    Returns:
+        dict: {formato: ruta} de los archivos guardados (vacío si hay error)
+    """
+    paths = {fmt: f"{path_base}.{fmt}" for fmt in formats if fmt in ("txt", "srt", "vtt")}
+    if not paths:
+        return {}
+    
+    try:
+        # Asegurar que existe el directorio
+        os.makedirs(os.path.dirname(os.path.abspath(path_base)), exist_ok=True)
+        
+        with ExitStack() as stack:
+            files = {
+                fmt: stack.enter_context(
+                    open(path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE)
+                )
+                for fmt, path in paths.items()
+            }
+            
+            if "txt" in files:
+                files["txt"].write(transcription["text"].strip())
+            
+            srt = files.get("srt")
+            vtt = files.get("vtt")
+            if vtt:
+                vtt.write("WEBVTT\n\n")
+            if srt or vtt:
+                for i, segment in enumerate(transcription["segments"], start=1):
+                    text = segment['text'].strip()
+                    if srt:
+                        start = format_timestamp_srt(segment['start'])
+                        end = format_timestamp_srt(segment['end'])
+                        srt.write(f"{i}\n{start} --> {end}\n{text}\n\n")
+                    if vtt:
+                        start = format_timestamp_vtt(segment['start'])
+                        end = format_timestamp_vtt(segment['end'])
+                        vtt.write(f"{start} --> {end}\n{text}\n\n")
+        
+        logger.info(f"Transcripción guardada como {', '.join(paths).upper()}: {path_base}")
+        return paths
+    
+    except Exception as e:
+        logger.error(f"Error al guardar transcripción en {path_base}: {e}")
+        return {}
+
 def format_timestamp_srt(seconds):
     """
     Formatea segundos en formato SRT (HH:MM:SS,mmm)
@@ -168,6 +234,40 @@ def clean_text(text):
     
     return text.strip()
 
+def format_file_size(size_bytes):
+    """
+    Formatea un tamaño en bytes con la unidad binaria adecuada
+    
+    La unidad se obtiene de la longitud en bits del tamaño (cada unidad
+    son 10 bits), sin divisiones sucesivas.
+    
+    Args:
+        size_bytes (int): Tamaño en bytes
+    
+    Returns:
+        str: Tamaño formateado (p.ej. "1.50 MB")
+    """
+    size_bytes = max(0, int(size_bytes or 0))
+    unit_idx = min(len(_SIZE_UNITS) - 1, max(0, (size_bytes.bit_length() - 1) // 10))
+    return f"{size_bytes / (1 << (unit_idx * 10)):.2f} {_SIZE_UNITS[unit_idx]}"
+
+def count_words(text):
+    """
+    Cuenta las palabras de un texto
+    
+    Recorre el texto con un iterador en lugar de construir la lista de
+    split(), lo que evita duplicar en memoria transcripciones largas.
+    
+    Args:
+        text (str): Texto a analizar
+    
+    Returns:
+        int: Número de palabras
+    """
+    if not text:
+        return 0
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
 def merge_segments(segments, max_chars=120, max_duration=5.0):
     """
     Combina segmentos cortos para subtítulos más legibles
@@ -387,23 +487,32 @@ def extract_keywords(text, max_keywords=5, language='es'):
     text = text.lower()
     
     # Eliminar puntuación
-    text = re.sub(r'[^\w\s]', '', text)
-    
-    # Dividir en palabras
-    words = text.split()
+    text = _PUNCTUATION_RE.sub('', text)
     
-    # Eliminar palabras vacías (stopwords)
+    # Eliminar palabras vacías (stopwords) y contar frecuencia en una pasada
     stopwords = get_stopwords(language)
+    word_count = Counter(
+        word for word in text.split() if len(word) > 3 and word not in stopwords
+    )
     
-    filtered_words = [word for word in words if word not in stopwords and len(word) > 3]
-    
-    # Contar frecuencia
-    word_count = {}
-    for word in filtered_words:
-        word_count[word] = word_count.get(word, 0) + 1
+    # Tomar las N palabras más frecuentes (selección parcial, sin ordenar todo)
+    return [word for word, _ in word_count.most_common(max_keywords)]
+
+def transcription_keywords(transcription, max_keywords=5):
+    """
+    Extrae palabras clave de una transcripción en su idioma detectado
     
-    # Ordenar por frecuencia
-    sorted_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
+    Args:
+        transcription (dict): Resultado de transcripción de Whisper
+        max_keywords (int): Número máximo de palabras clave
     
-    # Tomar las N palabras más frecuentes
-    return [word for word, _ in sorted_words[:max_keywords]]
\ No newline at end of file
+    Returns:
+        list: Lista de palabras clave
+    """
+    language = transcription.get("language", "desconocido")
+    lang_code = language if language and language != "desconocido" else "es"
+    # Validar si el idioma está soportado por get_stopwords
+    if not get_stopwords(lang_code):
+        logger.warning(f"Idioma '{lang_code}' no soportado para palabras clave, usando 'es' como fallback.")
+        lang_code = "es"
+    return extract_keywords(transcription["text"], max_keywords=max_keywords, language=lang_code)
@@ -47,4 +47,12 @@ def test_normalize_audio():
         if os.path.exists(path):
             os.unlink(path)
         if 'normalized_path' in locals() and os.path.exists(normalized_path):
-            os.unlink(normalized_path)
\ No newline at end of file
+            os.unlink(normalized_path)
+
+def test_resample_audio():
+    arr = np.random.uniform(-1, 1, 44100).astype(np.float32)
+    resampled = audio_utils.resample_audio(arr, 44100, 16000)
+    assert resampled.shape == (16000,)
+    assert resampled.dtype == np.float32
+    # Misma tasa: se devuelve sin copiar
+    assert audio_utils.resample_audio(arr, 16000, 16000) is arr
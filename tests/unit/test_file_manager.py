@@ -27,4 +27,9 @@ def test_import_file_unsupported(file_manager):
             os.unlink(path)
 
 def test_export_transcription_empty(file_manager):
-    assert file_manager.export_transcription({}) == {} 
\ No newline at end of file
+    assert file_manager.export_transcription({}) == {} 
+
+def test_supported_file_filter_is_memoized(file_manager):
+    first = file_manager.get_supported_file_filter()
+    assert first is file_manager.get_supported_file_filter()
+    assert "*.mp3" in first and "*.mp4" in first
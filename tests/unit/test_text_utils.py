@@ -19,4 +19,37 @@ def test_split_long_segments():
     result = text_utils.split_long_segments(segs, max_chars=20, max_duration=5)
     assert len(result) > 1
     for seg in result:
-        assert len(seg["text"]) <= 25 
\ No newline at end of file
+        assert len(seg["text"]) <= 25 
+
+def test_count_words():
+    assert text_utils.count_words(" Hola  mundo,\n esto es una prueba ") == 6
+    assert text_utils.count_words("") == 0
+
+def test_save_formats_matches_single_writers(tmp_path):
+    transcription = {
+        "text": " Hola mundo. Adiós.",
+        "segments": [
+            {"start": 0.0, "end": 1.5, "text": " Hola mundo."},
+            {"start": 1.5, "end": 3.25, "text": " Adiós."},
+        ],
+    }
+    base = str(tmp_path / "multi")
+    paths = text_utils.save_formats(transcription, base)
+    assert set(paths) == {"txt", "srt", "vtt"}
+    for fmt, saver in (("txt", text_utils.save_txt), ("srt", text_utils.save_srt), ("vtt", text_utils.save_vtt)):
+        single = str(tmp_path / f"single.{fmt}")
+        saver(transcription, single)
+        with open(paths[fmt], encoding="utf-8") as a, open(single, encoding="utf-8") as b:
+            assert a.read() == b.read()
+
+def test_format_file_size():
+    assert text_utils.format_file_size(0) == "0.00 B"
+    assert text_utils.format_file_size(1023) == "1023.00 B"
+    assert text_utils.format_file_size(1024) == "1.00 KB"
+    assert text_utils.format_file_size(int(1.5 * 1024 ** 2)) == "1.50 MB"
+    assert text_utils.format_file_size(3 * 1024 ** 4) == "3.00 TB"
+
+
+def test_transcription_keywords_unknown_language():
+    transcription = {"text": "prueba prueba python", "language": "xx"}
+    assert text_utils.transcription_keywords(transcription, max_keywords=1) == ["prueba"]
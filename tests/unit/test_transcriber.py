@@ -2,6 +2,8 @@ import pytest
 from whisper_app.core.transcriber import Transcriber
 from whisper_app.core.config_manager import ConfigManager
 import os
+import sys
+import types
 
 class DummyConfig(ConfigManager):
     def __init__(self):
@@ -40,4 +42,44 @@ def test_transcribe_file_no_model(monkeypatch, transcriber, tmp_path):
     fake_file = tmp_path / "test.wav"
     fake_file.write_bytes(b"data")
     result = transcriber.transcribe_file(str(fake_file))
-    assert result is None 
\ No newline at end of file
+    assert result is None 
+
+def test_is_model_cached(monkeypatch, transcriber, tmp_path):
+    fake_whisper = types.SimpleNamespace(_MODELS={
+        "base": "https://example.com/models/abc/base.pt",
+        "large": "https://example.com/models/def/large-v2.pt",
+    })
+    monkeypatch.setitem(sys.modules, "whisper", fake_whisper)
+    transcriber.config.config["model_cache_dir"] = str(tmp_path)
+    assert transcriber.is_model_cached("base") is False
+    (tmp_path / "whisper").mkdir()
+    (tmp_path / "whisper" / "base.pt").write_bytes(b"")
+    assert transcriber.is_model_cached("base") is True
+    # "large" se guarda con el nombre versionado de su URL
+    (tmp_path / "whisper" / "large.pt").write_bytes(b"")
+    assert transcriber.is_model_cached("large") is False
+    (tmp_path / "whisper" / "large-v2.pt").write_bytes(b"")
+    assert transcriber.is_model_cached("large") is True
+    assert transcriber.is_model_cached("desconocido") is False
+
+
+def test_compact_result():
+    result = {
+        "text": " hola",
+        "segments": [{"id": 0, "seek": 0, "start": 0.0, "end": 1.5, "text": " hola",
+                      "tokens": [50364, 2704], "avg_logprob": -0.2, "no_speech_prob": 0.01}]
+    }
+    Transcriber.compact_result(result)
+    assert result["segments"] == [{"id": 0, "start": 0.0, "end": 1.5, "text": " hola"}]
+
+def test_load_model_failure_not_reported_as_transcription_error(monkeypatch, transcriber):
+    def failing_load(*a, **kw):
+        raise RuntimeError("checkpoint dañado")
+    monkeypatch.setitem(sys.modules, "whisper", types.SimpleNamespace(load_model=failing_load))
+    errors, progress = [], []
+    transcriber.signals.error.connect(errors.append)
+    transcriber.signals.progress.connect(lambda value, message: progress.append(value))
+    assert transcriber.load_model("base", quiet=True) is False
+    # El fallo queda para quien pidió la carga, sin señales de error ni progreso
+    assert "checkpoint dañado" in transcriber.load_error
+    assert errors == [] and progress == []
@@ -0,0 +1,54 @@
+import pytest
+import os
+from whisper_app.core.transcription_cache import TranscriptionCache, compute_audio_hash
+
+class DummyConfig:
+    def __init__(self):
+        self.config = {"cache_max_mb": 500}
+    def get(self, key, default=None):
+        return self.config.get(key, default)
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.delenv('WHISPERAPP_NO_CACHE', raising=False)
+    return TranscriptionCache(DummyConfig(), cache_dir=str(tmp_path / "transcripts"))
+
+def test_compute_audio_hash(tmp_path):
+    path = tmp_path / "audio.wav"
+    path.write_bytes(b"datos de audio")
+    assert compute_audio_hash(str(path)) == compute_audio_hash(str(path), chunk_size=3)
+
+def test_compute_audio_hash_empty_file(tmp_path):
+    path = tmp_path / "vacio.wav"
+    path.write_bytes(b"")
+    assert compute_audio_hash(str(path)) == "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+def test_make_key_depends_on_options():
+    key = TranscriptionCache.make_key("abc", "base", "es")
+    assert key == TranscriptionCache.make_key("abc", "base", "es")
+    assert key != TranscriptionCache.make_key("abc", "small", "es")
+    assert key != TranscriptionCache.make_key("abc", "base", "es", "en")
+
+def test_put_and_get(cache):
+    result = {"result": {"text": "hola", "segments": []}, "time": 1.0}
+    assert cache.get("clave") is None
+    assert cache.put("clave", result)
+    assert cache.get("clave") == result
+
+def test_corrupt_entry_is_discarded(cache):
+    os.makedirs(cache.cache_dir, exist_ok=True)
+    path = os.path.join(cache.cache_dir, "clave.json")
+    with open(path, 'w') as f:
+        f.write('{corrupt json')
+    assert cache.get("clave") is None
+    assert not os.path.exists(path)
+
+def test_disabled_by_env(cache, monkeypatch):
+    monkeypatch.setenv('WHISPERAPP_NO_CACHE', '1')
+    assert not cache.put("clave", {"time": 1.0})
+    assert cache.get("clave") is None
+
+def test_eviction(cache):
+    cache.config.config["cache_max_mb"] = 0
+    cache.put("clave", {"time": 1.0})
+    assert cache.get("clave") is None